@@ -8,7 +8,7 @@ from typing import Optional
 from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
-from sqlalchemy import event
+from sqlalchemy import event, select, func
 
 # SQLAlchemy Base 클래스 생성
 Base = declarative_base()
@@ -46,14 +46,17 @@ class BaseModel(Base, TimestampMixin):
             session.rollback()
             raise e
     
-    def update(self, session: Session, **kwargs) -> 'BaseModel':
-        """모델을 업데이트합니다."""
+    def update(self, session: Session, commit: bool = True, **kwargs) -> 'BaseModel':
+        """모델을 업데이트합니다. (commit=False이면 변경만 반영하고 커밋은 호출자에게 맡김)"""
         try:
             for key, value in kwargs.items():
                 if hasattr(self, key):
                     setattr(self, key, value)
             
             self.updated_at = datetime.utcnow()
+            if not commit:
+                return self
+            
             session.commit()
             session.refresh(self)
             return self
@@ -112,12 +115,12 @@ class BaseModel(Base, TimestampMixin):
     @classmethod
     def count(cls, session: Session) -> int:
         """모델의 총 개수를 반환합니다."""
-        query = session.query(cls)
+        stmt = select(func.count()).select_from(cls)
         
         if hasattr(cls, 'is_deleted'):
-            query = query.filter(cls.is_deleted == False)
+            stmt = stmt.where(cls.is_deleted == False)
         
-        return query.count()
+        return session.scalar(stmt) or 0
 
 
 # 데이터베이스 이벤트 리스너 설정
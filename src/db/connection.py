@@ -7,7 +7,7 @@ import os
 import sqlite3
 from pathlib import Path
 from typing import Optional, Union
-from sqlalchemy import create_engine, Engine, text
+from sqlalchemy import create_engine, Engine, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 import sys
@@ -78,6 +78,7 @@ class DatabaseManager:
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,  # 커밋 후 속성 접근 시 다시 SELECT하지 않음
             bind=self.engine
         )
         
@@ -90,8 +91,11 @@ class DatabaseManager:
         user = self.config.get('user', 'postgres')
         password = self.config.get('password', '')
         dbname = self.config.get('dbname', 'file_monitor_db')
-        pool_size = self.config.get('pool_size', 5)
-        max_overflow = self.config.get('max_overflow', 10)
+        # 이벤트 처리 스레드 수에 맞춘 풀 크기 (오버플로 연결 생성/해제 반복 방지)
+        pool_size = self.config.get('pool_size', (os.cpu_count() or 1) * 2)
+        max_overflow = self.config.get('max_overflow', 0)
+        pool_pre_ping = self.config.get('pool_pre_ping', False)
+        pool_recycle = self.config.get('pool_recycle', 1800)
         
         # PostgreSQL 연결 문자열
         database_url = f"postgresql://{user}:{password}@{host}:{port}/{dbname}"
@@ -102,7 +106,8 @@ class DatabaseManager:
             poolclass=QueuePool,
             pool_size=pool_size,
             max_overflow=max_overflow,
-            pool_pre_ping=True,  # 연결 상태 확인
+            pool_pre_ping=pool_pre_ping,  # 체크아웃마다 연결 상태 확인 (기본 비활성화)
+            pool_recycle=pool_recycle,  # 오래된 연결은 체크아웃 시 새로 연결 (사전 확인 없이 서버 측 유휴 종료 회피)
             echo=False  # SQL 쿼리 로깅 (개발 시 True로 설정)
         )
         
@@ -110,6 +115,7 @@ class DatabaseManager:
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,  # 커밋 후 속성 접근 시 다시 SELECT하지 않음
             bind=self.engine
         )
         
@@ -147,6 +153,27 @@ class DatabaseManager:
             print("데이터베이스 테이블 생성 완료")
         except Exception as e:
             print(f"테이블 생성 실패: {e}")
+            return
+        
+        self.ensure_indexes(base)
+    
+    def ensure_indexes(self, base):
+        """
+        모델에 정의된 인덱스 중 기존 테이블에 없는 것을 생성합니다.
+        
+        create_all은 이미 있는 테이블을 변경하지 않으므로, 인덱스가 추가되기 전에 만든
+        데이터베이스에도 인덱스가 생기도록 테이블이 있는 경우 인덱스마다 존재 여부를 확인해 생성합니다.
+        """
+        try:
+            with self.engine.begin() as conn:
+                inspector = inspect(conn)
+                for table in base.metadata.sorted_tables:
+                    if not table.indexes or not inspector.has_table(table.name):
+                        continue
+                    for index in table.indexes:
+                        index.create(bind=conn, checkfirst=True)
+        except Exception as e:
+            print(f"인덱스 생성 실패: {e}")
     
     def drop_tables(self, base):
         """데이터베이스 테이블을 삭제합니다."""
@@ -22,6 +22,7 @@ from src.services.scheduler import MonitoringScheduler
 from src.services.file_processor import FileProcessor
 from src.services.upload_service import UploadService
 from src.db.connection import DatabaseManager
+from src.db.base import Base
 from config.settings import get_config
 
 
@@ -82,6 +83,9 @@ class FileMonitorApp:
             self.db_manager = DatabaseManager()
             self.logger.info("데이터베이스 매니저 초기화 완료")
             
+            # 기존 데이터베이스에 새로 추가된 모델 인덱스 생성 (이미 있으면 건너뜀)
+            self.db_manager.ensure_indexes(Base)
+            
             # 파일 모니터 서비스 초기화
             self.file_monitor = FileMonitorService()
             self.logger.info("파일 모니터 서비스 초기화 완료")
@@ -3,9 +3,10 @@
 모니터링된 파일의 기본 정보를 저장하는 모델입니다.
 """
 
+import os
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, JSON, Index, text, select, func
 from sqlalchemy.orm import Session
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -26,6 +27,16 @@ class FileInfo(BaseModel, SoftDeleteMixin):
         self.logger = get_logger(__name__)
     
     __tablename__ = 'file_infos'
+    __table_args__ = (
+        # 스케줄러 주기 쿼리용 인덱스 (업로드 대기 조회, 오래된 레코드 정리, 폴더별 통계)
+        Index(
+            'ix_fileinfo_pending', 'processing_status',
+            postgresql_where=text("processing_status = 'pending'"),
+            sqlite_where=text("processing_status = 'pending'"),
+        ),
+        Index('ix_fileinfo_scan_date', 'scan_date', 'is_deleted'),
+        Index('ix_fileinfo_folder', 'folder_name'),
+    )
     
     # 파일 기본 정보
     file_path = Column(String(500), nullable=False, unique=True, comment='파일의 절대 경로')
@@ -58,10 +69,8 @@ class FileInfo(BaseModel, SoftDeleteMixin):
         return f"<FileInfo(id={self.id}, file_name='{self.file_name}', status='{self.processing_status}')>"
     
     @classmethod
-    def create_from_path(cls, session: Session, file_path: str, base_folder: str, **kwargs) -> 'FileInfo':
-        """파일 경로로부터 FileInfo를 생성합니다."""
-        from pathlib import Path
-        
+    def build_values_from_path(cls, file_path: str, base_folder: str, stat_info: Optional[os.stat_result] = None, **kwargs) -> dict:
+        """파일 경로로부터 FileInfo 컬럼 값 딕셔너리를 생성합니다."""
         path_obj = Path(file_path)
         base_folder_obj = Path(base_folder)
         
@@ -75,9 +84,10 @@ class FileInfo(BaseModel, SoftDeleteMixin):
         folder_name = base_folder_obj.name
         
         # 파일 정보 수집
-        stat_info = path_obj.stat()
+        if stat_info is None:
+            stat_info = path_obj.stat()
         
-        file_info = cls(
+        return dict(
             file_path=str(file_path),
             file_name=path_obj.name,
             file_size=stat_info.st_size,
@@ -91,13 +101,42 @@ class FileInfo(BaseModel, SoftDeleteMixin):
             is_image=path_obj.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'],
             **kwargs
         )
+    
+    @classmethod
+    def create_from_path(cls, session: Session, file_path: str, base_folder: str, **kwargs) -> 'FileInfo':
+        """파일 경로로부터 FileInfo를 생성합니다."""
+        file_info = cls(**cls.build_values_from_path(file_path, base_folder, **kwargs))
         
         return file_info.save(session)
     
-    def mark_processing(self, session: Session) -> 'FileInfo':
+    @classmethod
+    def insert_ignore_existing(cls, session: Session, rows: list) -> int:
+        """
+        file_path가 이미 존재하는 행은 건너뛰고 한 번의 INSERT로 추가합니다.
+        
+        SQLite는 INSERT OR IGNORE, PostgreSQL은 ON CONFLICT DO NOTHING으로 실행되며
+        file_path의 unique 제약을 이용합니다. 커밋은 호출자가 수행합니다.
+        
+        Returns:
+            실제로 추가된 행 수
+        """
+        if not rows:
+            return 0
+        
+        dialect_name = session.get_bind().dialect.name
+        if dialect_name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        
+        stmt = insert(cls).values(rows).on_conflict_do_nothing(index_elements=['file_path'])
+        result = session.execute(stmt)
+        return max(result.rowcount, 0)
+    
+    def mark_processing(self, session: Session, commit: bool = True) -> 'FileInfo':
         """처리 중으로 표시합니다."""
         self.processing_status = 'processing'
-        return self.update(session)
+        return self.update(session, commit=commit)
     
     def mark_processed(self, session: Session) -> 'FileInfo':
         """처리 완료로 표시합니다."""
@@ -245,18 +284,20 @@ class FileInfo(BaseModel, SoftDeleteMixin):
     def get_file_count_by_status(cls, session: Session) -> dict:
         """상태별 파일 개수를 반환합니다."""
         statuses = ['new', 'processing', 'processed', 'error']
-        counts = {}
+        counts = dict.fromkeys(statuses, 0)
         
-        for status in statuses:
-            count = session.query(cls).filter(
-                cls.processing_status == status,
-                cls.is_deleted == False
-            ).count()
+        # 상태별 COUNT를 GROUP BY 한 번으로 조회
+        rows = session.execute(
+            select(cls.processing_status, func.count())
+            .where(cls.processing_status.in_(statuses), cls.is_deleted == False)
+            .group_by(cls.processing_status)
+        )
+        for status, count in rows:
             counts[status] = count
         
         return counts
     
-    def extract_image_metadata(self, session: Session) -> bool:
+    def extract_image_metadata(self, session: Session, commit: bool = True) -> bool:
         """이미지 파일의 메타데이터를 추출합니다."""
         try:
             if not self.is_image:
@@ -319,7 +360,7 @@ class FileInfo(BaseModel, SoftDeleteMixin):
                 self.updated_at = datetime.utcnow()
                 
                 # 데이터베이스에 저장
-                self.update(session)
+                self.update(session, commit=commit)
                 
                 return True
                 
@@ -328,34 +369,72 @@ class FileInfo(BaseModel, SoftDeleteMixin):
             self.processing_status = 'error'
             self.error_message = str(e)
             self.updated_at = datetime.utcnow()
-            self.update(session)
+            self.update(session, commit=commit)
             return False
     
-    def calculate_checksum(self, session: Session, algorithm: str = 'sha256') -> str:
-        """파일의 체크섬을 계산합니다."""
+    def set_checksum(self, session: Session, checksum: str, algorithm: str = 'sha256', commit: bool = True) -> 'FileInfo':
+        """계산된 체크섬을 extra_data에 저장합니다."""
+        if not self.extra_data:
+            self.extra_data = {}
+        self.extra_data['checksum'] = {
+            'algorithm': algorithm,
+            'value': checksum
+        }
+        
+        return self.update(session, commit=commit)
+    
+    def calculate_checksum(self, session: Session, algorithm: str = 'sha256', chunk_size: int = 1024 * 1024, prefetch: bool = False, file_size: Optional[int] = None, commit: bool = True) -> str:
+        """
+        파일의 체크섬을 계산합니다.
+        
+        prefetch=True이면 읽기 전에 커널에 전체 미리 읽기를 요청하고,
+        file_size를 알고 있고 한 청크보다 작으면 버퍼 없이 pread 한 번으로 읽습니다.
+        """
         try:
             import hashlib
-            import os
             
-            if not os.path.exists(self.file_path):
+            hasher = hashlib.new(algorithm)
+            
+            # 존재 여부를 따로 확인하지 않고 파일을 한 번만 열어 모든 읽기에 같은 fd를 재사용
+            # (버퍼링 없이 열어 BufferedReader를 거치는 추가 복사를 피함)
+            try:
+                f = open(self.file_path, 'rb', buffering=0)
+            except FileNotFoundError:
                 return ""
             
-            hasher = hashlib.new(algorithm)
-            with open(self.file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hasher.update(chunk)
+            with f:
+                offset = 0
+                complete = False
+                
+                if file_size is not None and file_size < chunk_size:
+                    # file_size + 1바이트를 요청해 짧게 읽히면 EOF까지 읽은 것 (그 사이 커졌으면 이어서 읽음)
+                    data = os.pread(f.fileno(), file_size + 1, 0)
+                    hasher.update(data)
+                    offset = len(data)
+                    complete = offset <= file_size
+                
+                if not complete:
+                    # ZFS/NFS 등에서 청크 단위 동기 읽기가 직렬화되지 않도록 비동기 readahead 유도
+                    if prefetch and hasattr(os, 'posix_fadvise'):
+                        try:
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                        except OSError:
+                            pass
+                    
+                    # 큰 버퍼 하나를 재사용해 읽기 시스템 콜 수와 할당을 줄임
+                    # (hashlib은 큰 입력에서 GIL을 해제하므로 여러 작업자 스레드의 읽기/해시가 겹쳐 실행됨)
+                    buffer = bytearray(chunk_size)
+                    view = memoryview(buffer)
+                    f.seek(offset)
+                    while True:
+                        read_size = f.readinto(buffer)
+                        if not read_size:
+                            break
+                        hasher.update(view[:read_size])
             
             checksum = hasher.hexdigest()
             
-            # 체크섬을 extra_data에 저장
-            if not self.extra_data:
-                self.extra_data = {}
-            self.extra_data['checksum'] = {
-                'algorithm': algorithm,
-                'value': checksum
-            }
-            
-            self.update(session)
+            self.set_checksum(session, checksum, algorithm=algorithm, commit=commit)
             return checksum
             
         except Exception as e:
@@ -4,7 +4,8 @@ API 응답 정보를 저장하는 모델입니다.
 """
 
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Float, JSON
 from sqlalchemy.orm import Session
 
@@ -57,25 +58,39 @@ class UploadResult(BaseModel, SoftDeleteMixin):
         return f"<UploadResult(id={self.id}, file_name='{self.file_name}', status='{self.upload_status}')>"
     
     @classmethod
-    def create_from_file_info(cls, session: Session, file_path: str, folder_name: str, **kwargs) -> 'UploadResult':
-        """파일 정보로부터 UploadResult를 생성합니다."""
+    def create_from_file_info(cls, session: Session, file_path: str, folder_name: str, commit: bool = True, **kwargs) -> 'UploadResult':
+        """파일 정보로부터 UploadResult를 생성합니다. (commit=False이면 세션에 추가만 하고 커밋은 호출자에게 맡김)"""
         from pathlib import Path
         
         path_obj = Path(file_path)
         
-        upload_result = cls(
+        values = dict(
             file_path=file_path,
             file_name=path_obj.name,
-            file_size=path_obj.stat().st_size if path_obj.exists() else 0,
             file_extension=path_obj.suffix.lower(),
             folder_name=folder_name,
             scan_date=datetime.utcnow(),
-            **kwargs
+            upload_status='pending',
+            upload_attempts=0
         )
+        values.update(kwargs)
+        
+        # 호출자가 파일 크기를 전달하지 않은 경우에만 stat 수행
+        if 'file_size' not in values:
+            try:
+                values['file_size'] = path_obj.stat().st_size
+            except FileNotFoundError:
+                values['file_size'] = 0
+        
+        upload_result = cls(**values)
+        
+        if not commit:
+            session.add(upload_result)
+            return upload_result
         
         return upload_result.save(session)
     
-    def update_api_response(self, session: Session, api_response: dict) -> 'UploadResult':
+    def update_api_response(self, session: Session, api_response: dict, commit: bool = True) -> 'UploadResult':
         """API 응답 정보로 모델을 업데이트합니다."""
         # API 응답에서 정보 추출
         self.api_file_id = api_response.get('file_id')
@@ -98,9 +113,9 @@ class UploadResult(BaseModel, SoftDeleteMixin):
         self.upload_attempts += 1
         self.last_upload_attempt = datetime.utcnow()
         
-        return self.update(session)
+        return self.update(session, commit=commit)
     
-    def mark_upload_failed(self, session: Session, error_message: str, error_details: Optional[dict] = None) -> 'UploadResult':
+    def mark_upload_failed(self, session: Session, error_message: str, error_details: Optional[dict] = None, commit: bool = True) -> 'UploadResult':
         """업로드 실패로 표시합니다."""
         self.upload_status = 'failed'
         self.upload_attempts += 1
@@ -108,7 +123,7 @@ class UploadResult(BaseModel, SoftDeleteMixin):
         self.error_message = error_message
         self.error_details = error_details
         
-        return self.update(session)
+        return self.update(session, commit=commit)
     
     def mark_in_progress(self, session: Session) -> 'UploadResult':
         """업로드 진행 중으로 표시합니다."""
@@ -125,18 +140,31 @@ class UploadResult(BaseModel, SoftDeleteMixin):
         
         return self.update(session)
     
+    @classmethod
+    def get_uploads_after(cls, session: Session, upload_status: str, after_id: int = 0, chunk_size: int = 100) -> list:
+        """해당 상태의 파일들을 id 순으로 after_id 다음부터 chunk_size개 조회합니다. (키셋 페이지네이션)"""
+        return session.query(cls).filter(
+            cls.upload_status == upload_status,
+            cls.is_deleted == False,
+            cls.id > after_id
+        ).order_by(cls.id.asc()).limit(chunk_size).all()
+    
+    @classmethod
+    def iter_pending_uploads(cls, session: Session, chunk_size: int = 100) -> Iterator['UploadResult']:
+        """업로드 대기 중인 파일들을 chunk_size개씩 나눠 조회하며 반환합니다."""
+        after_id = 0
+        while True:
+            chunk = cls.get_uploads_after(session, 'pending', after_id, chunk_size)
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            after_id = chunk[-1].id
+    
     @classmethod
     def get_pending_uploads(cls, session: Session, limit: Optional[int] = None) -> list:
-        """업로드 대기 중인 파일들을 조회합니다."""
-        query = session.query(cls).filter(
-            cls.upload_status == 'pending',
-            cls.is_deleted == False
-        ).order_by(cls.created_at.asc())
-        
-        if limit:
-            query = query.limit(limit)
-        
-        return query.all()
+        """업로드 대기 중인 파일들을 조회합니다. (생성 순서인 id 순)"""
+        chunk_size = min(limit, 100) if limit else 100
+        return list(islice(cls.iter_pending_uploads(session, chunk_size), limit or None))
     
     @classmethod
     def get_failed_uploads(cls, session: Session, limit: Optional[int] = None) -> list:
@@ -5,6 +5,7 @@ API 클라이언트 서비스
 
 import os
 import time
+import logging
 import requests
 from datetime import datetime
 from pathlib import Path
@@ -24,20 +25,28 @@ from config.settings import get_config
 class APIClient:
     """API 엔드포인트와 통신하는 클라이언트"""
     
-    def __init__(self):
+    def __init__(self, pool_size: Optional[int] = None, max_retries: Optional[int] = None,
+                 logger: Optional[logging.Logger] = None, check_availability: bool = True):
         # 설정 로드
         self.config = get_config()
         
-        # 로거 설정
-        self.logger_manager = LoggerManager()
-        self.logger = self.logger_manager.get_logger(__name__)
+        # 로거 설정 (로거를 넘겨받으면 로그 파일/감시 스레드를 만드는 LoggerManager를 생성하지 않음)
+        if logger is None:
+            self.logger_manager = LoggerManager()
+            self.logger = self.logger_manager.get_logger(__name__)
+        else:
+            self.logger_manager = None
+            self.logger = logger
         
         # API 설정
         self.api_config = self.config.get('api', {})
         self.base_url = self.api_config.get('endpoint', 'http://211.231.137.111:18000')
         self.upload_endpoint = self.api_config.get('upload_endpoint', '/upload')
         self.timeout = self.api_config.get('timeout_seconds', 30)
-        self.max_retries = self.api_config.get('retry_attempts', 3)
+        # 요청 내부 재시도 횟수 (호출 측에서 백오프로 재시도하는 경우 0을 넘겨 한 번만 시도)
+        if max_retries is None:
+            max_retries = self.api_config.get('retry_attempts', 3)
+        self.max_retries = max_retries
         self.retry_delay = self.api_config.get('retry_delay_seconds', 5)
         self.max_file_size = self.api_config.get('max_file_size', 10 * 1024 * 1024)  # 10MB
         
@@ -51,23 +60,27 @@ class APIClient:
             'Accept-Encoding': 'gzip, deflate'
         })
         
-        # 연결 풀 설정
+        # 연결 풀 설정 (세션을 공유하는 동시 업로드 수만큼 연결 유지)
+        if pool_size is None:
+            pool_size = self.config.get('upload', {}).get('max_concurrent_uploads', 5)
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
             max_retries=0  # 자체 재시도 로직 사용
         )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         
-        # API 상태
-        self.is_available = False
+        # API 상태 (check_availability가 False면 가용성 확인 요청 없이 바로 업로드 시도)
+        self.check_availability = check_availability
+        self.is_available = not check_availability
         self.last_check = None
         self.check_interval = 300  # 5분마다 상태 확인
         
         # 초기화
         self._validate_config()
-        self._check_api_availability()
+        if self.check_availability:
+            self._check_api_availability()
     
     def _validate_config(self):
         """API 설정을 검증합니다."""
@@ -138,7 +151,7 @@ class APIClient:
                 raise ValueError(f"파일 크기가 너무 큽니다: {file_size} bytes (최대: {self.max_file_size} bytes)")
             
             # API 가용성 확인
-            if not self._check_api_availability():
+            if self.check_availability and not self._check_api_availability():
                 raise ConnectionError("API 서버에 연결할 수 없습니다.")
             
             self.logger.info(f"파일 업로드 시작: {file_path} ({file_size} bytes)")
@@ -162,6 +175,7 @@ class APIClient:
                 return {
                     'success': False,
                     'error': error_msg,
+                    'http_status': response.get('http_status'),
                     'file_path': str(file_path),
                     'file_size': file_size,
                     'upload_time': datetime.now()
@@ -189,15 +203,6 @@ class APIClient:
         if not mime_type:
             mime_type = 'application/octet-stream'
         
-        # 파일 데이터 준비
-        files = {
-            'file': (
-                file_path.name,
-                open(file_path, 'rb'),
-                mime_type
-            )
-        }
-        
         # 추가 메타데이터
         data = {}
         if metadata:
@@ -215,13 +220,15 @@ class APIClient:
             try:
                 self.logger.debug(f"업로드 시도 {attempt + 1}/{self.max_retries + 1}: {file_path}")
                 
-                response = self.session.post(
-                    upload_url,
-                    files=files,
-                    data=data,
-                    timeout=self.timeout,
-                    allow_redirects=True
-                )
+                # 시도마다 파일을 새로 열어 전달 (재시도 시 닫힌 핸들/끝 위치 재사용 방지)
+                with open(file_path, 'rb') as file_obj:
+                    response = self.session.post(
+                        upload_url,
+                        files={'file': (file_path.name, file_obj, mime_type)},
+                        data=data,
+                        timeout=self.timeout,
+                        allow_redirects=True
+                    )
                 
                 # 응답 처리
                 return self._process_response(response, file_path)
@@ -267,11 +274,6 @@ class APIClient:
                         'success': False,
                         'error': f'요청 오류 - 최대 재시도 횟수 초과: {str(e)}'
                     }
-                
-            finally:
-                # 파일 핸들 정리
-                if 'file' in files:
-                    files['file'][1].close()
         
         return {
             'success': False,
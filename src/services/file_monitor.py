@@ -5,11 +5,16 @@
 
 import os
 import time
+import queue
+import logging
+import threading
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Callable
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileModifiedEvent, FileDeletedEvent
+from sqlalchemy import select, func, update
 
 # 프로젝트 루트를 Python 경로에 추가
 import sys
@@ -17,6 +22,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.logger import LoggerManager
+from src.utils.bloom_filter import BloomFilter
 from src.models.file_info import FileInfo
 from src.db.connection import DatabaseManager
 from config.settings import get_config
@@ -29,14 +35,23 @@ class FileChangeHandler(FileSystemEventHandler):
         self.monitor_service = monitor_service
         self.logger = monitor_service.logger
         
-        # 처리할 파일 확장자
-        self.image_extensions = monitor_service.config.get('monitor', {}).get('image_extensions', ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'])
+        # DEBUG 레벨 활성화 여부 (비활성 시 디버그 메시지 포맷팅 생략)
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
         
-        # 최대 파일 크기 (바이트)
-        self.max_file_size = monitor_service.config.get('monitor', {}).get('max_file_size', 100 * 1024 * 1024)  # 100MB
+        # 처리할 파일 확장자 / 최대 파일 크기 (서비스에서 한 번만 계산된 값 사용)
+        self.image_extensions = monitor_service._ext_set
+        self.max_file_size = monitor_service._max_size
         
         # 처리 중인 파일들을 추적 (중복 처리 방지)
         self.processing_files = set()
+        
+        # 이벤트 디바운스 (밀리초, 0이면 비활성화)
+        # 시간 버킷 링: 각 버킷은 해당 시간 구간에 이벤트가 발생한 경로들을 보관하며
+        # 링이 전진할 때 가장 오래된 버킷만 비우므로 별도 정리 작업이 필요 없음
+        self._bucket_count = 4
+        self._bucket_sec = monitor_service._debounce_sec / self._bucket_count
+        self._buckets = [set() for _ in range(self._bucket_count)]
+        self._bucket_tick = int(time.monotonic() / self._bucket_sec) if self._bucket_sec > 0 else 0
     
     def on_created(self, event):
         """새 파일이 생성되었을 때 호출됩니다."""
@@ -55,61 +70,87 @@ class FileChangeHandler(FileSystemEventHandler):
     
     def _handle_file_event(self, file_path: str, event_type: str):
         """파일 이벤트를 처리합니다."""
-        try:
-            # 이미 처리 중인 파일인지 확인
-            if file_path in self.processing_files:
-                self.logger.debug(f"파일 {file_path} 이미 처리 중입니다.")
-                return
-            
-            # 파일 경로를 Path 객체로 변환
-            path_obj = Path(file_path)
-            
-            # 파일이 실제로 존재하는지 확인
-            if not path_obj.exists():
-                self.logger.debug(f"파일 {file_path}이 존재하지 않습니다.")
+        # 이미 처리 중인 파일인지 확인
+        if file_path in self.processing_files:
+            if self._debug:
+                self.logger.debug("파일 %s 이미 처리 중입니다.", file_path)
+            return
+        
+        # 파일 경로를 Path 객체로 변환
+        path_obj = Path(file_path)
+        
+        # 이미지 파일인지 확인
+        if not self._is_image_file(path_obj):
+            if self._debug:
+                self.logger.debug("파일 %s은 이미지 파일이 아닙니다.", file_path)
+            return
+        
+        # 디바운스 구간 내 반복 이벤트 무시 (삭제 이벤트는 항상 처리)
+        if event_type != 'deleted' and self._is_debounced(file_path):
+            if self._debug:
+                self.logger.debug("파일 %s 이벤트 디바운스", file_path)
+            return
+        
+        # 삭제 이벤트는 stat 없이 바로 처리, 그 외에는 한 번의 stat으로 존재 여부와 크기 확인
+        if event_type != 'deleted':
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                if self._debug:
+                    self.logger.debug("파일 %s이 존재하지 않습니다.", file_path)
                 return
-            
-            # 이미지 파일인지 확인
-            if not self._is_image_file(path_obj):
-                self.logger.debug(f"파일 {file_path}은 이미지 파일이 아닙니다.")
+            except OSError as e:
+                self.logger.warning(f"파일 {file_path} 접근 실패: {str(e)}")
                 return
             
             # 파일 크기 확인
-            if not self._is_valid_file_size(path_obj):
+            if file_size > self.max_file_size:
                 self.logger.warning(f"파일 {file_path}의 크기가 너무 큽니다.")
                 return
+        
+        # 처리 중인 파일로 표시
+        self.processing_files.add(file_path)
+        
+        # 옵저버 스레드 경계: 여기서 한 번만 로깅 (트레이스백은 DEBUG에서만)
+        try:
+            if event_type == 'created':
+                self._handle_new_file(path_obj)
+            elif event_type == 'modified':
+                self._handle_modified_file(path_obj)
+            elif event_type == 'deleted':
+                self._handle_deleted_file(path_obj)
             
-            # 처리 중인 파일로 표시
-            self.processing_files.add(file_path)
-            
-            try:
-                if event_type == 'created':
-                    self._handle_new_file(path_obj)
-                elif event_type == 'modified':
-                    self._handle_modified_file(path_obj)
-                elif event_type == 'deleted':
-                    self._handle_deleted_file(path_obj)
-                
-            finally:
-                # 처리 완료 후 추적에서 제거
-                self.processing_files.discard(file_path)
-                
         except Exception as e:
-            self.logger.error(f"파일 이벤트 처리 중 오류 발생: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"파일 이벤트 처리 중 오류 발생: {file_path} - {str(e)}", exc_info=self._debug)
+            
+        finally:
+            # 처리 완료 후 추적에서 제거
+            self.processing_files.discard(file_path)
+    
+    def _is_debounced(self, file_path: str) -> bool:
+        """디바운스 구간 내에 같은 경로의 이벤트가 있었는지 확인하고 현재 이벤트를 기록합니다."""
+        if self._bucket_sec <= 0:
+            return False
+        
+        tick = int(time.monotonic() / self._bucket_sec)
+        elapsed = tick - self._bucket_tick
+        
+        if elapsed > 0:
+            # 지나간 구간의 버킷들을 비우고 링을 전진 (최대 버킷 수만큼)
+            for i in range(1, min(elapsed, self._bucket_count) + 1):
+                self._buckets[(self._bucket_tick + i) % self._bucket_count].clear()
+            self._bucket_tick = tick
+        
+        if any(file_path in bucket for bucket in self._buckets):
+            return True
+        
+        self._buckets[tick % self._bucket_count].add(file_path)
+        return False
     
     def _is_image_file(self, path_obj: Path) -> bool:
         """파일이 이미지 파일인지 확인합니다."""
         return path_obj.suffix.lower() in self.image_extensions
     
-    def _is_valid_file_size(self, path_obj: Path) -> bool:
-        """파일 크기가 유효한지 확인합니다."""
-        try:
-            file_size = path_obj.stat().st_size
-            return file_size <= self.max_file_size
-        except OSError:
-            return False
-    
     def _handle_new_file(self, path_obj: Path):
         """새 파일을 처리합니다."""
         self.logger.info(f"새 파일 감지: {path_obj}")
@@ -126,7 +167,8 @@ class FileChangeHandler(FileSystemEventHandler):
     
     def _handle_modified_file(self, path_obj: Path):
         """수정된 파일을 처리합니다."""
-        self.logger.debug(f"파일 수정 감지: {path_obj}")
+        if self._debug:
+            self.logger.debug("파일 수정 감지: %s", path_obj)
         
         # 수정된 파일도 새 파일과 동일하게 처리
         self._handle_new_file(path_obj)
@@ -149,7 +191,8 @@ class FileChangeHandler(FileSystemEventHandler):
                 
                 # 파일 크기가 안정화되었는지 확인
                 if current_size == last_size and current_size > 0:
-                    self.logger.debug(f"파일 {path_obj} 안정화 완료 (크기: {current_size} bytes)")
+                    if self._debug:
+                        self.logger.debug("파일 %s 안정화 완료 (크기: %d bytes)", path_obj, current_size)
                     return
                 
                 last_size = current_size
@@ -181,6 +224,13 @@ class FileMonitorService:
         self.base_folders = self.monitor_config.get('base_folders', [])
         self.scan_interval = self.monitor_config.get('scan_interval', 60)  # 초
         
+        # 이벤트/스캔 경로에서 사용하는 설정 값 (생성 시 한 번만 계산)
+        self._ext_set = frozenset(
+            ext.lower() for ext in self.monitor_config.get('image_extensions', ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'])
+        )
+        self._max_size = int(self.monitor_config.get('max_file_size', 100 * 1024 * 1024))  # 100MB
+        self._debounce_sec = self.monitor_config.get('debounce_ms', 2000) / 1000
+        
         # 파일 변경 핸들러
         self.event_handler = FileChangeHandler(self)
         
@@ -194,6 +244,15 @@ class FileMonitorService:
         # 콜백 함수
         self.on_new_file_callback: Optional[Callable[[Path], None]] = None
         
+        # 데이터베이스에 등록된 파일 경로 블룸 필터 (스캔 시 지연 생성)
+        self._known_paths: Optional[BloomFilter] = None
+        
+        # 삭제 이벤트 배치 처리 (대량 삭제 시 세션/커밋을 묶어서 처리)
+        self._delete_q: "queue.Queue[str]" = queue.Queue()
+        self._delete_batch_size = 500
+        self._delete_stop_event = threading.Event()
+        self._delete_thread: Optional[threading.Thread] = None
+        
         # 초기화
         self._validate_folders()
     
@@ -248,6 +307,16 @@ class FileMonitorService:
             
             # Observer 시작
             self.observer.start()
+            
+            # 삭제 배치 워커 시작 (Observer 시작이 성공한 뒤에 시작해 실패 후 재시도 시 워커가 중복되지 않도록 함,
+            # 그 사이에 들어온 삭제 이벤트는 큐에 쌓였다가 처리됨)
+            self._delete_stop_event.clear()
+            self._delete_thread = threading.Thread(
+                target=self._delete_worker,
+                name="FileDeleteWorker",
+                daemon=True
+            )
+            self._delete_thread.start()
             self.is_monitoring = True
             
             self.logger.info(f"✅ 파일 모니터링 시작 완료 (모니터링 폴더: {len(self.monitored_paths)}개)")
@@ -270,6 +339,12 @@ class FileMonitorService:
             self.observer.stop()
             self.observer.join()
             
+            # 삭제 배치 워커 중지 (남은 삭제 요청은 처리 후 종료)
+            self._delete_stop_event.set()
+            if self._delete_thread:
+                self._delete_thread.join(timeout=10)
+                self._delete_thread = None
+            
             self.is_monitoring = False
             self.monitored_paths.clear()
             
@@ -301,42 +376,61 @@ class FileMonitorService:
                 )
                 
                 self.logger.info(f"파일 정보 데이터베이스 저장 완료: {file_path}")
-                self.logger.debug(f"  - ID: {file_info.id}")
-                self.logger.debug(f"  - 폴더: {file_info.folder_name}")
-                self.logger.debug(f"  - 크기: {file_info.file_size} bytes")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("  - ID: %s", file_info.id)
+                    self.logger.debug("  - 폴더: %s", file_info.folder_name)
+                    self.logger.debug("  - 크기: %s bytes", file_info.file_size)
                 
             finally:
                 session.close()
                 
         except Exception as e:
-            self.logger.error(f"파일 정보 데이터베이스 저장 실패: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"파일 정보 데이터베이스 저장 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
     
     def mark_file_deleted(self, file_path: Path):
-        """삭제된 파일을 데이터베이스에 표시합니다."""
-        try:
-            # 데이터베이스 세션 생성
-            session = self.db_manager.get_session()
-            
+        """
+        삭제된 파일을 데이터베이스에 표시합니다.
+        
+        모니터링 중에는 삭제 큐에 넣고 배치 워커가 여러 경로를 한 번의 UPDATE로 처리합니다.
+        워커가 실행 중이 아니면 즉시 처리합니다. (단일 행은 FileInfo.delete(session)도 사용 가능)
+        """
+        if self._delete_thread and self._delete_thread.is_alive():
+            self._delete_q.put(str(file_path))
+        else:
+            self._mark_files_deleted([str(file_path)])
+    
+    def _delete_worker(self):
+        """삭제 큐에서 경로들을 모아 배치로 삭제 표시합니다."""
+        while not (self._delete_stop_event.is_set() and self._delete_q.empty()):
             try:
-                # 파일 정보 조회
-                file_info = session.query(FileInfo).filter(
-                    FileInfo.file_path == str(file_path)
-                ).first()
+                paths = [self._delete_q.get(timeout=1)]
+            except queue.Empty:
+                continue
+            
+            # 대기 중인 삭제 요청을 배치 크기만큼 함께 처리
+            while len(paths) < self._delete_batch_size:
+                try:
+                    paths.append(self._delete_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            self._mark_files_deleted(paths)
+    
+    def _mark_files_deleted(self, file_paths: List[str]):
+        """여러 파일을 한 번의 UPDATE로 소프트 삭제 표시합니다."""
+        try:
+            with closing(self.db_manager.get_session()) as session:
+                result = session.execute(
+                    update(FileInfo)
+                    .where(FileInfo.file_path.in_(file_paths), FileInfo.is_deleted == False)
+                    .values(is_deleted=True, deleted_at=datetime.utcnow())
+                )
+                session.commit()
                 
-                if file_info:
-                    # 소프트 삭제로 표시
-                    file_info.delete(session)
-                    self.logger.info(f"파일 삭제 표시 완료: {file_path}")
-                else:
-                    self.logger.debug(f"데이터베이스에 없는 파일 삭제: {file_path}")
-                
-            finally:
-                session.close()
+                self.logger.info(f"파일 삭제 표시 완료: {result.rowcount}개 (요청 {len(file_paths)}개)")
                 
         except Exception as e:
-            self.logger.error(f"파일 삭제 표시 실패: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"파일 삭제 표시 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
     
     def _find_base_folder(self, file_path: Path) -> Optional[Path]:
         """파일이 속한 기본 폴더를 찾습니다."""
@@ -404,8 +498,7 @@ class FileMonitorService:
             }
             
         except Exception as e:
-            self.logger.error(f"새로운 날짜 폴더 확인 실패: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"새로운 날짜 폴더 확인 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
             
             return {
                 'status': 'error',
@@ -423,6 +516,90 @@ class FileMonitorService:
             'observer_alive': self.observer.is_alive() if hasattr(self.observer, 'is_alive') else False
         }
     
+    def _walk_files(self, base_path: Path):
+        """
+        기본 폴더 아래의 모든 파일을 순회합니다.
+        
+        os.fwalk를 지원하는 플랫폼에서는 디렉토리 FD를 재사용하여 순회하고
+        (dirpath, filename, dir_fd)를 반환합니다. 지원하지 않는 플랫폼(Windows)에서는
+        rglob으로 대체하며 dir_fd는 None입니다.
+        """
+        if hasattr(os, 'fwalk'):
+            for dirpath, _dirnames, filenames, dir_fd in os.fwalk(str(base_path)):
+                for filename in filenames:
+                    yield dirpath, filename, dir_fd
+        else:
+            for file_path in base_path.rglob('*'):
+                if file_path.is_file():
+                    yield str(file_path.parent), file_path.name, None
+    
+    def _get_known_paths(self, session) -> BloomFilter:
+        """DB에 등록된 파일 경로로 블룸 필터를 구성합니다. (DB 크기가 용량을 넘으면 재구성)"""
+        if self._known_paths is not None and not self._known_paths.is_saturated:
+            return self._known_paths
+        
+        file_count = session.scalar(select(func.count()).select_from(FileInfo)) or 0
+        known_paths = BloomFilter(capacity=max(file_count * 2, 1024), error_rate=0.001)
+        
+        # 경로를 스트리밍으로 읽어 메모리 사용량을 제한
+        result = session.execute(
+            select(FileInfo.file_path).execution_options(yield_per=10000)
+        )
+        for (file_path,) in result:
+            known_paths.add(file_path)
+        
+        self._known_paths = known_paths
+        self.logger.debug(f"파일 경로 블룸 필터 구성 완료: {file_count}개")
+        return known_paths
+    
+    def _build_scan_row(self, file_path: str, base_folder: str, filename: str = None, dir_fd: Optional[int] = None) -> Optional[dict]:
+        """스캔한 파일의 크기를 확인하고 INSERT할 행을 생성합니다."""
+        try:
+            if dir_fd is not None:
+                stat_info = os.stat(filename, dir_fd=dir_fd)
+            else:
+                stat_info = os.stat(file_path)
+        except OSError:
+            self.logger.warning(f"파일 접근 실패: {file_path}")
+            return None
+        
+        if stat_info.st_size > self._max_size:
+            return None
+        
+        return FileInfo.build_values_from_path(
+            file_path=file_path,
+            base_folder=base_folder,
+            stat_info=stat_info
+        )
+    
+    def _resolve_scan_candidates(self, session, candidates: List[tuple]) -> List[dict]:
+        """블룸 필터 양성 경로 중 실제로 DB에 없는 파일의 행만 반환합니다."""
+        if not candidates:
+            return []
+        
+        existing_paths = set(session.scalars(
+            select(FileInfo.file_path).where(FileInfo.file_path.in_([path for path, _ in candidates]))
+        ))
+        
+        rows = []
+        for file_path, base_folder in candidates:
+            if file_path not in existing_paths:
+                row = self._build_scan_row(file_path, base_folder)
+                if row:
+                    rows.append(row)
+        
+        return rows
+    
+    def _insert_scan_rows(self, session, rows: List[dict]) -> int:
+        """스캔 행을 INSERT하고 블룸 필터에 경로를 등록합니다."""
+        added = FileInfo.insert_ignore_existing(session, rows)
+        
+        if self._known_paths is not None:
+            for row in rows:
+                self._known_paths.add(row['file_path'])
+        
+        return added
+    
     def scan_existing_files(self):
         """기존 파일들을 스캔하여 데이터베이스에 추가합니다."""
         try:
@@ -435,40 +612,55 @@ class FileMonitorService:
                 total_files = 0
                 added_files = 0
                 
+                # 한 번의 INSERT로 처리할 행 수
+                batch_size = 500
+                pending_rows = []
+                
+                ext_set = self._ext_set
+                
+                # 블룸 필터에 있는 경로만 DB에 이미 존재할 가능성이 있음
+                known_paths = self._get_known_paths(session)
+                candidates = []
+                
                 for base_folder in self.base_folders:
                     base_path = Path(base_folder)
                     
                     # 모든 하위 폴더를 재귀적으로 스캔
-                    for file_path in base_path.rglob('*'):
-                        if file_path.is_file():
-                            total_files += 1
+                    for dirpath, filename, dir_fd in self._walk_files(base_path):
+                        total_files += 1
+                        
+                        # 이미지 파일인지 확인
+                        if os.path.splitext(filename)[1].lower() in ext_set:
+                            file_path = os.path.join(dirpath, filename)
+                            
+                            if file_path in known_paths:
+                                # 존재 가능성이 있는 파일은 모아서 한 번에 확인
+                                candidates.append((file_path, str(base_path)))
+                                if len(candidates) >= batch_size:
+                                    pending_rows.extend(self._resolve_scan_candidates(session, candidates))
+                                    candidates = []
+                            else:
+                                # 블룸 필터에 없으면 확실히 새 파일
+                                row = self._build_scan_row(file_path, str(base_path), filename, dir_fd)
+                                if row:
+                                    pending_rows.append(row)
                             
-                            # 이미지 파일인지 확인
-                            if file_path.suffix.lower() in self.monitor_config.get('image_extensions', ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']):
-                                # 파일 크기 확인
-                                try:
-                                    if file_path.stat().st_size <= self.monitor_config.get('max_file_size', 100 * 1024 * 1024):
-                                        # 데이터베이스에 이미 존재하는지 확인
-                                        existing_file = session.query(FileInfo).filter(
-                                            FileInfo.file_path == str(file_path)
-                                        ).first()
-                                        
-                                        if not existing_file:
-                                            # 새 파일 정보 생성
-                                            FileInfo.create_from_path(
-                                                session=session,
-                                                file_path=str(file_path),
-                                                base_folder=str(base_path)
-                                            )
-                                            added_files += 1
-                                            
-                                            self.logger.debug(f"기존 파일 추가: {file_path}")
-                                    
-                                except OSError:
-                                    self.logger.warning(f"파일 접근 실패: {file_path}")
+                            if len(pending_rows) >= batch_size:
+                                added_files += self._insert_scan_rows(session, pending_rows)
+                                pending_rows = []
+                
+                pending_rows.extend(self._resolve_scan_candidates(session, candidates))
+                added_files += self._insert_scan_rows(session, pending_rows)
+                
+                # 전체 스캔을 하나의 트랜잭션으로 커밋
+                session.commit()
                 
                 self.logger.info(f"기존 파일 스캔 완료: 총 {total_files}개 파일, {added_files}개 추가")
                 
+            except Exception:
+                session.rollback()
+                raise
+                
             finally:
                 session.close()
                 
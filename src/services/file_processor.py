@@ -4,27 +4,127 @@
 """
 
 import os
+import mmap
+import stat
+import hashlib
 import time
+import itertools
+import functools
 import threading
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Tuple
-from queue import Queue, Empty
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+from sqlalchemy.orm import Session
+
 # 프로젝트 루트를 Python 경로에 추가
 import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.utils.logger import LoggerManager
+from src.utils.fast_stat import fast_stat
+from src.utils.bounded_queue import BoundedMPMCQueue
 from src.models.file_info import FileInfo
 from src.models.upload_result import UploadResult
 from src.db.connection import DatabaseManager
 from config.settings import get_config
 
 
+# 확장자별 MIME 타입
+_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.bmp': 'image/bmp',
+    '.tiff': 'image/tiff'
+}
+
+# 기본 허용 확장자 (monitor.image_extensions 설정이 없을 때)
+_ALLOWED_EXT = frozenset(_MIME)
+
+# 시뮬레이션 업로드 응답의 URL 접두사
+_DL_PREFIX = "http://example.com/download/"
+_VIEW_PREFIX = "http://example.com/view/"
+
+# 이 크기를 넘는 파일은 mmap 대신 청크 단위로 읽어 체크섬 계산
+_MMAP_CHECKSUM_LIMIT = 1024 * 1024 * 1024  # 1GB
+
+# 청크 단위 읽기가 동기적으로 직렬화되기 쉬운 파일 시스템
+_ASYNC_IO_FILESYSTEMS = frozenset({'zfs', 'nfs', 'nfs4', 'cifs', 'smb3'})
+
+
+def _mount_filesystem_type(path: Path) -> Optional[str]:
+    """/proc/self/mountinfo에서 경로가 속한 마운트의 파일 시스템 종류를 찾습니다."""
+    try:
+        with open('/proc/self/mountinfo', encoding='utf-8', errors='replace') as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    
+    target = os.path.realpath(path)
+    best_mount_point = ''
+    best_fs_type = None
+    
+    for line in lines:
+        # 형식: <id> <parent> <major:minor> <root> <mount point> <options> [...] - <fs type> <source> <super options>
+        mount_fields, separator, fs_fields = line.partition(' - ')
+        fields = mount_fields.split()
+        if not separator or len(fields) < 5:
+            continue
+        
+        mount_point = fields[4].replace('\\040', ' ')
+        if target != mount_point and not target.startswith(mount_point.rstrip('/') + '/'):
+            continue
+        
+        # 가장 긴 마운트 지점이 실제 마운트 (같은 지점이면 나중 항목이 위에 마운트된 것)
+        if len(mount_point) >= len(best_mount_point):
+            best_mount_point = mount_point
+            best_fs_type = fs_fields.split()[0]
+    
+    return best_fs_type
+
+
+def _mmap_sha256(file_path: Path, prefetch: bool = False) -> str:
+    """파일 전체를 mmap으로 매핑해 hashlib 호출 한 번으로 SHA-256을 계산합니다."""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if prefetch and hasattr(mmap, 'MADV_WILLNEED'):
+            mm.madvise(mmap.MADV_WILLNEED)
+        return hashlib.sha256(mm).hexdigest()
+
+
+class _ShardedTaskMap:
+    """경로별 FileTask 맵 (경로 해시로 16개 버킷에 나눠 버킷마다 별도 락 사용)"""
+    
+    SHARD_COUNT = 16
+    
+    def __init__(self):
+        self._shards: List[Tuple[threading.Lock, Dict[str, 'FileTask']]] = [
+            (threading.Lock(), {}) for _ in range(self.SHARD_COUNT)
+        ]
+    
+    def _shard(self, path: str) -> Tuple[threading.Lock, Dict[str, 'FileTask']]:
+        return self._shards[hash(path) & (self.SHARD_COUNT - 1)]
+    
+    def __setitem__(self, path: str, file_task: 'FileTask'):
+        lock, tasks = self._shard(path)
+        with lock:
+            tasks[path] = file_task
+    
+    def get(self, path: str) -> Optional['FileTask']:
+        lock, tasks = self._shard(path)
+        with lock:
+            return tasks.get(path)
+    
+    def __len__(self) -> int:
+        return sum(len(tasks) for _, tasks in self._shards)
+
+
 class FileStatus(Enum):
     """파일 처리 상태"""
     PENDING = "pending"
@@ -36,36 +136,38 @@ class FileStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileTask:
     """파일 처리 작업 정보"""
     file_path: Path
     file_info: FileInfo
     status: FileStatus
     priority: int = 0
-    created_at: datetime = None
-    updated_at: datetime = None
+    created_at: datetime = field(default_factory=datetime.now)
+    created_ns: int = field(default_factory=time.monotonic_ns, repr=False)
+    updated_at: int = field(default_factory=time.monotonic_ns)  # time.monotonic_ns() 값 (조회 시 updated_datetime으로 변환)
     error_message: str = None
     retry_count: int = 0
     max_retries: int = 3
+    file_mode: Optional[int] = None
+    file_size: Optional[int] = None
     
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+    @property
+    def updated_datetime(self) -> datetime:
+        """마지막 업데이트 시각을 created_at 기준의 datetime으로 변환합니다."""
+        return self.created_at + timedelta(microseconds=(self.updated_at - self.created_ns) // 1000)
     
     def update_status(self, status: FileStatus, error_message: str = None):
         """상태를 업데이트합니다."""
         self.status = status
-        self.updated_at = datetime.now()
+        self.updated_at = time.monotonic_ns()
         if error_message:
             self.error_message = error_message
     
     def increment_retry(self):
         """재시도 횟수를 증가시킵니다."""
         self.retry_count += 1
-        self.updated_at = datetime.now()
+        self.updated_at = time.monotonic_ns()
     
     def can_retry(self) -> bool:
         """재시도 가능한지 확인합니다."""
@@ -90,24 +192,55 @@ class FileProcessor:
         self.processing_config = self.config.get('file_processing', {})
         self.max_concurrent_uploads = self.processing_config.get('max_concurrent_uploads', 5)
         self.chunk_size = self.processing_config.get('chunk_size', 8192)
+        self.checksum_chunk_size = self.processing_config.get('checksum_chunk_size', 1024 * 1024)
+        self.force_async_io = self.processing_config.get('force_async_io')
+        
+        # 유효성 검사에서 사용하는 설정 값 (생성 시 한 번만 계산)
+        monitor_config = self.config.get('monitor', {})
+        image_extensions = monitor_config.get('image_extensions')
+        self._ext_set = frozenset(ext.lower() for ext in image_extensions) if image_extensions else _ALLOWED_EXT
+        self._max_size = int(monitor_config.get('max_file_size', 100 * 1024 * 1024))  # 100MB
+        
+        # 기본 폴더는 한 번만 resolve (긴 경로 우선으로 정렬해 중첩된 폴더도 올바르게 매칭)
+        self._resolved_bases = sorted(
+            ((os.path.join(os.path.realpath(base_folder), ''), Path(base_folder))
+             for base_folder in monitor_config.get('base_folders', [])),
+            key=lambda item: -len(item[0])
+        )
+        # 파일이 들어있는 디렉토리의 실제 경로 캐시 (같은 디렉토리의 파일들은 realpath를 한 번만 수행)
+        self._resolve_dir = functools.lru_cache(maxsize=4096)(os.path.realpath)
         self.temp_directory = self.processing_config.get('temp_directory', '/tmp/file_monitor')
         self.cleanup_temp_files = self.processing_config.get('cleanup_temp_files', True)
+        self.queue_maxsize = self.processing_config.get('queue_maxsize', 0)
+        self.queue_batch_size = self.processing_config.get('queue_batch_size', 16)
         
         # 업로드 큐
-        self.upload_queue = Queue()
-        self.processing_queue = Queue()
+        self.upload_queue = BoundedMPMCQueue(maxsize=self.queue_maxsize)
         
-        # 처리 중인 파일들
-        self.processing_files: Dict[str, FileTask] = {}
-        self.uploading_files: Dict[str, FileTask] = {}
+        # 처리 작업자별 링 (라운드 로빈으로 분배하고 빈 작업자는 다른 링에서 훔쳐옴)
+        self.processing_rings: List[BoundedMPMCQueue] = [
+            BoundedMPMCQueue(maxsize=self.queue_maxsize)
+            for _ in range(self.max_concurrent_uploads)
+        ]
+        self._ring_counter = itertools.count()
         
-        # 스레드 락
-        self.processing_lock = threading.Lock()
-        self.uploading_lock = threading.Lock()
+        # 처리/업로드 작업자 풀 (큐에 작업이 있을 때만 배치 작업을 제출하므로 유휴 작업자가 폴링하지 않음)
+        self._proc_pool: Optional[ThreadPoolExecutor] = None
+        self._upload_pool: Optional[ThreadPoolExecutor] = None
         
-        # 작업자 스레드들
-        self.processing_threads: List[threading.Thread] = []
-        self.upload_threads: List[threading.Thread] = []
+        # 실행 중인 배치 작업 (처리는 링마다 최대 하나, 업로드는 최대 max_concurrent_uploads개)
+        self._slot_lock = threading.Lock()
+        self._proc_active = [False] * self.max_concurrent_uploads
+        self._upload_active = 0
+        
+        # 업로드 완료 목록 (완료한 작업자 중 하나가 모아서 성공 콜백을 한꺼번에 호출)
+        self._completed_uploads: deque = deque()
+        self._harvest_lock = threading.Lock()
+        
+        # 처리 중인 파일들
+        # (경로별로 샤딩된 락을 사용하므로 서로 다른 파일의 등록이 같은 락을 두고 경쟁하지 않음)
+        self.processing_files = _ShardedTaskMap()
+        self.uploading_files = _ShardedTaskMap()
         
         # 시스템 상태
         self.is_running = False
@@ -121,7 +254,8 @@ class FileProcessor:
         
         # 초기화
         self._setup_temp_directory()
-        self._start_worker_threads()
+        self._setup_async_io()
+        self._start_worker_pools()
     
     def _setup_temp_directory(self):
         """임시 디렉토리를 설정합니다."""
@@ -134,69 +268,167 @@ class FileProcessor:
             # 기본 임시 디렉토리 사용
             self.temp_directory = '/tmp'
     
-    def _start_worker_threads(self):
-        """작업자 스레드들을 시작합니다."""
-        # 파일 처리 스레드들
-        for i in range(self.max_concurrent_uploads):
-            thread = threading.Thread(
-                target=self._processing_worker,
-                name=f"FileProcessor-{i}",
-                daemon=True
-            )
-            thread.start()
-            self.processing_threads.append(thread)
-        
-        # 업로드 스레드들
-        for i in range(self.max_concurrent_uploads):
-            thread = threading.Thread(
-                target=self._upload_worker,
-                name=f"UploadWorker-{i}",
-                daemon=True
-            )
-            thread.start()
-            self.upload_threads.append(thread)
+    def _setup_async_io(self):
+        """체크섬 읽기 전에 미리 읽기 힌트를 줄지 결정합니다. (설정이 없으면 파일 시스템으로 판단)"""
+        if self.force_async_io is not None:
+            return
         
-        self.logger.info(f"작업자 스레드 시작 완료: 처리 {len(self.processing_threads)}개, 업로드 {len(self.upload_threads)}개")
+        base_folders = self.config.get('monitor', {}).get('base_folders', [])
+        fs_types = {_mount_filesystem_type(Path(base_folder)) for base_folder in base_folders}
+        
+        self.force_async_io = bool(fs_types & _ASYNC_IO_FILESYSTEMS)
+        if self.force_async_io:
+            self.logger.info(f"비동기 미리 읽기 사용: 파일 시스템 {sorted(fs_types & _ASYNC_IO_FILESYSTEMS)}")
     
-    def _processing_worker(self):
-        """파일 처리 작업자 스레드"""
-        while not self.shutdown_event.is_set():
-            try:
-                # 처리 큐에서 작업 가져오기
+    def _start_worker_pools(self):
+        """처리/업로드 작업자 풀을 생성하고, 큐에 남아 있는 작업이 있으면 처리를 재개합니다."""
+        self._proc_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_uploads,
+            thread_name_prefix='FileProcessor'
+        )
+        self._upload_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_uploads,
+            thread_name_prefix='UploadWorker'
+        )
+        
+        # 중지 중에 큐에 남은 작업 처리 재개
+        for worker_index, ring in enumerate(self.processing_rings):
+            if ring.qsize():
+                self._kick_processing(worker_index)
+        if self.upload_queue.qsize():
+            self._kick_upload()
+        
+        self.logger.info(f"작업자 풀 생성 완료: 처리 {self.max_concurrent_uploads}개, 업로드 {self.max_concurrent_uploads}개")
+    
+    def _enqueue_processing(self, file_task: FileTask):
+        """처리 작업을 작업자별 링에 라운드 로빈으로 추가합니다. (링이 가득 차면 빈 자리가 생길 때까지 대기)"""
+        ring_index = next(self._ring_counter) % len(self.processing_rings)
+        self.processing_rings[ring_index].put(file_task)
+        self._kick_processing(ring_index)
+    
+    def _enqueue_upload(self, file_task: FileTask):
+        """처리가 끝난 작업을 업로드 큐에 추가합니다. (큐가 가득 차면 빈 자리가 생길 때까지 대기)"""
+        self.upload_queue.put(file_task)
+        
+        # 업로드 중인 파일로 표시
+        self.uploading_files[str(file_task.file_path)] = file_task
+        
+        self.logger.info(f"파일 업로드 큐에 추가: {file_task.file_path}")
+        
+        self._kick_upload()
+    
+    def _kick_processing(self, worker_index: int):
+        """해당 작업자의 배치 작업이 실행 중이 아니면 처리 풀에 제출합니다."""
+        with self._slot_lock:
+            pool = self._proc_pool
+            if pool is None or self._proc_active[worker_index]:
+                return
+            self._proc_active[worker_index] = True
+        
+        try:
+            pool.submit(self._processing_batch, worker_index)
+        except RuntimeError:
+            # 풀이 종료됨 (중지 또는 인터프리터 종료): 작업은 링에 남아 다음 시작 시 처리
+            with self._slot_lock:
+                self._proc_active[worker_index] = False
+    
+    def _kick_upload(self):
+        """실행 중인 업로드 배치 작업이 작업자 수보다 적으면 업로드 풀에 하나 더 제출합니다."""
+        with self._slot_lock:
+            pool = self._upload_pool
+            if pool is None or self._upload_active >= self.max_concurrent_uploads:
+                return
+            self._upload_active += 1
+        
+        try:
+            pool.submit(self._upload_batch)
+        except RuntimeError:
+            with self._slot_lock:
+                self._upload_active -= 1
+    
+    def _next_processing_batch(self, worker_index: int) -> Tuple[BoundedMPMCQueue, List[FileTask]]:
+        """자기 링에서 작업을 가져오고, 비어 있으면 다른 링에서 훔쳐옵니다. (작업을 꺼낸 링도 함께 반환)"""
+        rings = self.processing_rings
+        own_ring = rings[worker_index]
+        
+        file_tasks = own_ring.get_batch(max_n=self.queue_batch_size, timeout=0)
+        if file_tasks:
+            return own_ring, file_tasks
+        
+        # 이웃 링부터 차례로 대기 작업의 절반까지 훔쳐옴
+        for offset in range(1, len(rings)):
+            victim_ring = rings[(worker_index + offset) % len(rings)]
+            file_tasks = victim_ring.get_batch(max_n=self.queue_batch_size, timeout=0, consumers=2)
+            if file_tasks:
+                return victim_ring, file_tasks
+        
+        return own_ring, []
+    
+    def _processing_batch(self, worker_index: int):
+        """처리 풀 작업: 작업자 링(또는 다른 링)에서 배치 하나를 꺼내 하나의 DB 세션으로 처리합니다."""
+        try:
+            ring, file_tasks = self._next_processing_batch(worker_index)
+            if file_tasks:
+                # 배치 전체에서 하나의 DB 세션 공유
+                session = self.db_manager.get_session()
                 try:
-                    file_task = self.processing_queue.get(timeout=1)
-                except Empty:
-                    continue
-                
-                # 파일 처리
-                self._process_file(file_task)
-                
-                # 작업 완료 표시
-                self.processing_queue.task_done()
-                
-            except Exception as e:
-                self.logger.error(f"파일 처리 작업자 오류: {str(e)}")
-                self.logger.exception("상세 에러 정보:")
+                    for file_task in file_tasks:
+                        try:
+                            # 파일 처리 후 업로드 대상이면 업로드 큐로 넘김
+                            if self._process_file(file_task, session):
+                                self._enqueue_upload(file_task)
+                        finally:
+                            # 작업을 꺼낸 링에 완료 표시
+                            ring.task_done()
+                finally:
+                    session.close()
+        
+        except Exception as e:
+            self.logger.error(f"파일 처리 작업자 오류: {str(e)}")
+            self.logger.exception("상세 에러 정보:")
+        
+        finally:
+            with self._slot_lock:
+                self._proc_active[worker_index] = False
+            
+            # 남은 작업이 있으면 다음 배치를 이어서 제출
+            # (작업마다 배치 하나만 처리하므로 풀 종료 시 남은 작업 전체를 기다리지 않음)
+            if any(ring.qsize() for ring in self.processing_rings):
+                self._kick_processing(worker_index)
     
-    def _upload_worker(self):
-        """업로드 작업자 스레드"""
-        while not self.shutdown_event.is_set():
-            try:
-                # 업로드 큐에서 작업 가져오기
+    def _upload_batch(self):
+        """업로드 풀 작업: 업로드 큐에서 배치 하나를 꺼내 하나의 DB 세션으로 업로드합니다."""
+        try:
+            # 대기 작업 수에 따라 배치 크기 조정
+            file_tasks = self.upload_queue.get_batch(
+                max_n=self.queue_batch_size,
+                timeout=0,
+                consumers=self.max_concurrent_uploads
+            )
+            if file_tasks:
+                # 배치 전체에서 하나의 DB 세션 공유
+                session = self.db_manager.get_session()
                 try:
-                    file_task = self.upload_queue.get(timeout=1)
-                except Empty:
-                    continue
-                
-                # 파일 업로드
-                self._upload_file(file_task)
-                
-                # 작업 완료 표시
-                self.upload_queue.task_done()
-                
-            except Exception as e:
-                self.logger.error(f"업로드 작업자 오류: {str(e)}")
-                self.logger.exception("상세 에러 정보:")
+                    for file_task in file_tasks:
+                        try:
+                            # 파일 업로드
+                            self._upload_file(file_task, session)
+                        finally:
+                            # 작업 완료 표시
+                            self.upload_queue.task_done()
+                finally:
+                    session.close()
+        
+        except Exception as e:
+            self.logger.error(f"업로드 작업자 오류: {str(e)}")
+            self.logger.exception("상세 에러 정보:")
+        
+        finally:
+            with self._slot_lock:
+                self._upload_active -= 1
+            
+            if self.upload_queue.qsize():
+                self._kick_upload()
     
     def add_file(self, file_path: Path, priority: int = 0) -> str:
         """새 파일을 처리 큐에 추가합니다."""
@@ -213,11 +445,10 @@ class FileProcessor:
             )
             
             # 처리 큐에 추가
-            self.processing_queue.put(file_task)
+            self._enqueue_processing(file_task)
             
             # 처리 중인 파일로 표시
-            with self.processing_lock:
-                self.processing_files[str(file_path)] = file_task
+            self.processing_files[str(file_path)] = file_task
             
             self.logger.info(f"파일 처리 큐에 추가: {file_path} (우선순위: {priority})")
             
@@ -260,55 +491,76 @@ class FileProcessor:
     
     def _find_base_folder(self, file_path: Path) -> Optional[Path]:
         """파일이 속한 기본 폴더를 찾습니다."""
-        # 설정에서 모니터링 폴더들 가져오기
-        monitor_config = self.config.get('monitor', {})
-        base_folders = monitor_config.get('base_folders', [])
+        resolved_path = os.path.join(self._resolve_dir(str(file_path.parent)), file_path.name)
         
-        for base_folder in base_folders:
-            base_path = Path(base_folder)
-            try:
-                if file_path.resolve().is_relative_to(base_path.resolve()):
-                    return base_path
-            except ValueError:
-                continue
+        for resolved_base, base_path in self._resolved_bases:
+            if resolved_path.startswith(resolved_base):
+                return base_path
         
         return None
     
-    def _process_file(self, file_task: FileTask):
-        """파일을 처리합니다."""
+    def _process_file(self, file_task: FileTask, session: Session) -> bool:
+        """파일을 처리합니다. 업로드할 준비가 되면 True를 반환합니다."""
         try:
             file_path = file_task.file_path
             file_info = file_task.file_info
             
+            # 분리된 FileInfo를 작업 세션에 연결
+            session.add(file_info)
+            
             self.logger.info(f"파일 처리 시작: {file_path}")
             
-            # 상태를 처리 중으로 업데이트
+            # 상태를 처리 중으로 업데이트 (DB 커밋은 처리 완료/실패 시 한 번만 수행)
             file_task.update_status(FileStatus.PROCESSING)
-            file_info.mark_processing(self.db_manager.get_session())
+            file_info.mark_processing(session, commit=False)
+            
+            # 파일 종류와 크기를 한 번만 조회하여 이후 단계에서 재사용
+            try:
+                file_task.file_mode, file_task.file_size = fast_stat(file_path)
+            except FileNotFoundError:
+                file_task.update_status(FileStatus.FAILED, "파일이 존재하지 않습니다")
+                file_info.mark_error(session, "파일이 존재하지 않습니다")
+                return False
             
             # 파일 유효성 검사
-            if not self._validate_file(file_path):
+            if not self._validate_file(file_path, file_task.file_mode, file_task.file_size):
                 file_task.update_status(FileStatus.FAILED, "파일 유효성 검사 실패")
-                file_info.mark_error(self.db_manager.get_session(), "파일 유효성 검사 실패")
-                return
+                file_info.mark_error(session, "파일 유효성 검사 실패")
+                return False
             
             # 파일 메타데이터 수집
             if file_info.is_image:
                 # 이미지 메타데이터 추출
-                success = file_info.extract_image_metadata(self.db_manager.get_session())
+                success = file_info.extract_image_metadata(session, commit=False)
                 if success:
                     self.logger.info(f"이미지 메타데이터 추출 완료: {file_path}")
                 else:
                     self.logger.warning(f"이미지 메타데이터 추출 실패: {file_path}")
             
             # 파일 체크섬 계산
-            checksum = file_info.calculate_checksum(self.db_manager.get_session())
+            if self.checksum_chunk_size <= file_task.file_size <= _MMAP_CHECKSUM_LIMIT:
+                # 파이썬 청크 루프 없이 매핑된 파일 전체를 한 번에 해시 (OpenSSL의 SHA 가속 명령 활용)
+                try:
+                    checksum = _mmap_sha256(file_path, prefetch=self.force_async_io)
+                    file_info.set_checksum(session, checksum, commit=False)
+                except (OSError, ValueError) as e:
+                    self.logger.error(f"체크섬 계산 실패: {str(e)}")
+                    checksum = ""
+            else:
+                # 한 청크보다 작은 파일은 pread 한 번, 1GB를 넘는 파일은 청크 단위로 읽음
+                checksum = file_info.calculate_checksum(
+                    session,
+                    chunk_size=self.checksum_chunk_size,
+                    prefetch=self.force_async_io,
+                    file_size=file_task.file_size,
+                    commit=False
+                )
             if checksum:
                 self.logger.info(f"파일 체크섬 계산 완료: {file_path} -> {checksum[:8]}...")
             
             # 파일 처리 완료
             file_task.update_status(FileStatus.COMPLETED)
-            file_info.mark_processed(self.db_manager.get_session())
+            file_info.mark_processed(session)
             
             self.logger.info(f"파일 처리 완료: {file_path}")
             
@@ -320,14 +572,10 @@ class FileProcessor:
             if self.on_file_ready_for_upload:
                 self.on_file_ready_for_upload(file_task)
             
-            # 업로드 큐에 추가
-            self.upload_queue.put(file_task)
-            
-            # 업로드 중인 파일로 표시
-            with self.uploading_lock:
-                self.uploading_files[str(file_path)] = file_task
-            
-            self.logger.info(f"파일 업로드 큐에 추가: {file_path}")
+            # 재시도 시 다른 작업자 세션에 연결될 수 있도록 배치 세션에서 분리
+            # (업로드 큐 추가는 _processing_batch에서 수행)
+            session.expunge(file_info)
+            return True
             
         except Exception as e:
             error_msg = f"파일 처리 실패: {str(e)}"
@@ -335,29 +583,29 @@ class FileProcessor:
             self.logger.exception("상세 에러 정보:")
             
             file_task.update_status(FileStatus.FAILED, error_msg)
-            file_info.mark_error(self.db_manager.get_session(), error_msg)
+            file_info.mark_error(session, error_msg)
             
             # 실패 콜백 호출
             if self.on_file_failed_callback:
                 self.on_file_failed_callback(file_task, error_msg)
+            
+            return False
     
-    def _validate_file(self, file_path: Path) -> bool:
-        """파일 유효성을 검사합니다."""
+    def _validate_file(self, file_path: Path, file_mode: int, file_size: int) -> bool:
+        """파일 유효성을 검사합니다. (모드/크기는 _process_file에서 조회한 결과)"""
         try:
-            # 파일 존재 확인
-            if not file_path.exists():
+            # 일반 파일인지 확인
+            if not stat.S_ISREG(file_mode):
+                self.logger.warning(f"일반 파일이 아닙니다: {file_path}")
                 return False
             
             # 파일 크기 확인
-            file_size = file_path.stat().st_size
-            max_size = self.config.get('monitor', {}).get('max_file_size', 100 * 1024 * 1024)
-            if file_size > max_size:
+            if file_size > self._max_size:
                 self.logger.warning(f"파일 크기가 너무 큽니다: {file_path} ({file_size} bytes)")
                 return False
             
             # 파일 확장자 확인
-            allowed_extensions = self.config.get('monitor', {}).get('image_extensions', ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'])
-            if file_path.suffix.lower() not in allowed_extensions:
+            if file_path.suffix.lower() not in self._ext_set:
                 self.logger.warning(f"지원하지 않는 파일 확장자: {file_path}")
                 return False
             
@@ -374,16 +622,7 @@ class FileProcessor:
             metadata = {}
             
             # MIME 타입 추정
-            extension = file_path.suffix.lower()
-            mime_types = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.bmp': 'image/bmp',
-                '.tiff': 'image/tiff'
-            }
-            metadata['mime_type'] = mime_types.get(extension, 'application/octet-stream')
+            metadata['mime_type'] = _MIME.get(file_path.suffix.lower(), 'application/octet-stream')
             
             # 이미지 크기 정보 (Pillow 사용)
             try:
@@ -402,7 +641,7 @@ class FileProcessor:
             self.logger.error(f"파일 메타데이터 추출 실패: {str(e)}")
             return None
     
-    def _upload_file(self, file_task: FileTask):
+    def _upload_file(self, file_task: FileTask, session: Session):
         """파일을 업로드합니다."""
         try:
             file_path = file_task.file_path
@@ -414,7 +653,7 @@ class FileProcessor:
             file_task.update_status(FileStatus.UPLOADING)
             
             # 업로드 결과 생성
-            upload_result = self._create_upload_result(file_task)
+            upload_result = self._create_upload_result(file_task, session)
             
             # 실제 업로드 수행 (여기서는 시뮬레이션)
             upload_response = self._perform_upload(file_path, upload_result)
@@ -423,22 +662,22 @@ class FileProcessor:
                 # 업로드 성공
                 file_task.update_status(FileStatus.UPLOADED)
                 upload_result.update_api_response(
-                    self.db_manager.get_session(),
+                    session,
                     upload_response['data']
                 )
                 
                 self.logger.info(f"파일 업로드 성공: {file_path}")
                 
-                # 성공 콜백 호출
-                if self.on_file_uploaded_callback:
-                    self.on_file_uploaded_callback(file_task, upload_response['data'])
+                # 성공 콜백은 완료 목록에 모아 일괄 호출
+                self._completed_uploads.append((file_task, upload_response['data']))
+                self._harvest_completions()
                 
             else:
                 # 업로드 실패
                 error_msg = upload_response.get('error', '알 수 없는 오류')
                 file_task.update_status(FileStatus.FAILED, error_msg)
                 upload_result.mark_upload_failed(
-                    self.db_manager.get_session(),
+                    session,
                     error_msg
                 )
                 
@@ -452,7 +691,7 @@ class FileProcessor:
                 if file_task.can_retry():
                     file_task.increment_retry()
                     file_task.update_status(FileStatus.PENDING)
-                    self.processing_queue.put(file_task)
+                    self._enqueue_processing(file_task)
                     self.logger.info(f"파일 재처리 큐에 추가: {file_path} (재시도 {file_task.retry_count}/{file_task.max_retries})")
             
         except Exception as e:
@@ -466,34 +705,61 @@ class FileProcessor:
             if self.on_file_failed_callback:
                 self.on_file_failed_callback(file_task, error_msg)
     
-    def _create_upload_result(self, file_task: FileTask) -> UploadResult:
-        """업로드 결과 레코드를 생성합니다."""
-        session = self.db_manager.get_session()
+    def _harvest_completions(self, max_batch: int = 64):
+        """
+        쌓인 업로드 완료를 최대 max_batch개씩 모아 성공 콜백을 호출합니다.
         
-        try:
-            # 기존 업로드 결과 조회
-            existing_result = session.query(UploadResult).filter(
-                UploadResult.file_path == str(file_task.file_path)
-            ).first()
-            
-            if existing_result:
-                return existing_result
-            
-            # 새 업로드 결과 생성
-            upload_result = UploadResult.create_from_file_info(
-                session=session,
-                file_path=str(file_task.file_path),
-                file_name=file_task.file_path.name,
-                file_size=file_task.file_path.stat().st_size,
-                file_extension=file_task.file_path.suffix.lower(),
-                folder_name=file_task.file_info.folder_name,
-                scan_date=datetime.now()
-            )
-            
-            return upload_result
+        다른 작업자가 이미 수집 중이면 기다리지 않고 그 작업자에게 맡기며,
+        수집한 작업자는 락을 놓은 뒤 목록을 다시 확인하므로 완료가 누락되지 않습니다.
+        """
+        while self._completed_uploads:
+            if not self._harvest_lock.acquire(blocking=False):
+                return
             
-        finally:
-            session.close()
+            try:
+                batch = []
+                while self._completed_uploads and len(batch) < max_batch:
+                    batch.append(self._completed_uploads.popleft())
+                
+                callback = self.on_file_uploaded_callback
+                if not callback:
+                    continue
+                
+                for file_task, response_data in batch:
+                    try:
+                        callback(file_task, response_data)
+                    except Exception as e:
+                        self.logger.error(f"업로드 성공 콜백 실패: {file_task.file_path} - {str(e)}")
+            finally:
+                self._harvest_lock.release()
+    
+    def _create_upload_result(self, file_task: FileTask, session: Session) -> UploadResult:
+        """업로드 결과 레코드를 생성합니다."""
+        # 기존 업로드 결과 조회
+        existing_result = session.query(UploadResult).filter(
+            UploadResult.file_path == str(file_task.file_path)
+        ).first()
+        
+        if existing_result:
+            return existing_result
+        
+        # 새 업로드 결과 생성 (처리 단계에서 조회한 stat 결과 재사용)
+        if file_task.file_size is not None:
+            file_size = file_task.file_size
+        else:
+            _, file_size = fast_stat(file_task.file_path)
+        
+        upload_result = UploadResult.create_from_file_info(
+            session=session,
+            file_path=str(file_task.file_path),
+            file_name=file_task.file_path.name,
+            file_size=file_size,
+            file_extension=file_task.file_path.suffix.lower(),
+            folder_name=file_task.file_info.folder_name,
+            scan_date=datetime.now()
+        )
+        
+        return upload_result
     
     def _perform_upload(self, file_path: Path, upload_result: UploadResult) -> Dict:
         """실제 파일 업로드를 수행합니다."""
@@ -505,13 +771,14 @@ class FileProcessor:
             file_size = file_path.stat().st_size
             
             # 시뮬레이션된 API 응답
+            name = file_path.name
             response_data = {
-                'api_file_id': f"file_{int(time.time())}_{file_path.stem}",
-                'api_filename': file_path.name,
+                'api_file_id': f"file_{time.time_ns() // 1_000_000_000}_{file_path.stem}",
+                'api_filename': name,
                 'api_file_size': file_size,
                 'api_upload_time': datetime.now(),
-                'download_url': f"http://example.com/download/{file_path.name}",
-                'view_url': f"http://example.com/view/{file_path.name}",
+                'download_url': _DL_PREFIX + name,
+                'view_url': _VIEW_PREFIX + name,
                 'api_message': 'Upload successful'
             }
             
@@ -530,7 +797,7 @@ class FileProcessor:
     def get_queue_status(self) -> Dict:
         """큐 상태 정보를 반환합니다."""
         return {
-            'processing_queue_size': self.processing_queue.qsize(),
+            'processing_queue_size': sum(ring.qsize() for ring in self.processing_rings),
             'upload_queue_size': self.upload_queue.qsize(),
             'processing_files_count': len(self.processing_files),
             'uploading_files_count': len(self.uploading_files),
@@ -540,25 +807,25 @@ class FileProcessor:
     def get_file_status(self, file_path: str) -> Optional[Dict]:
         """특정 파일의 상태 정보를 반환합니다."""
         # 처리 중인 파일에서 찾기
-        if file_path in self.processing_files:
-            task = self.processing_files[file_path]
+        task = self.processing_files.get(file_path)
+        if task:
             return {
                 'status': task.status.value,
                 'priority': task.priority,
                 'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat(),
+                'updated_at': task.updated_datetime.isoformat(),
                 'retry_count': task.retry_count,
                 'error_message': task.error_message
             }
         
         # 업로드 중인 파일에서 찾기
-        if file_path in self.uploading_files:
-            task = self.uploading_files[file_path]
+        task = self.uploading_files.get(file_path)
+        if task:
             return {
                 'status': task.status.value,
                 'priority': task.priority,
                 'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat(),
+                'updated_at': task.updated_datetime.isoformat(),
                 'retry_count': task.retry_count,
                 'error_message': task.error_message
             }
@@ -588,6 +855,10 @@ class FileProcessor:
             self.logger.warning("파일 처리 시스템이 이미 실행 중입니다.")
             return
         
+        # 중지 후 다시 시작하는 경우 작업자 풀 재생성
+        if self._proc_pool is None:
+            self._start_worker_pools()
+        
         self.is_running = True
         self.shutdown_event.clear()
         self.logger.info("파일 처리 시스템 시작")
@@ -602,9 +873,16 @@ class FileProcessor:
         self.shutdown_event.set()
         self.is_running = False
         
-        # 모든 큐 작업 완료 대기
-        self.processing_queue.join()
-        self.upload_queue.join()
+        # 실행 중인 배치 작업만 마치고 풀 종료 (링/큐에 남은 작업은 다음 시작 시 처리)
+        # (처리 풀을 먼저 종료해야 처리 중인 배치가 업로드 큐에 작업을 넘긴 뒤 업로드 풀이 닫힘)
+        with self._slot_lock:
+            proc_pool, self._proc_pool = self._proc_pool, None
+        if proc_pool:
+            proc_pool.shutdown(wait=True)
+        with self._slot_lock:
+            upload_pool, self._upload_pool = self._upload_pool, None
+        if upload_pool:
+            upload_pool.shutdown(wait=True)
         
         self.logger.info("파일 처리 시스템 중지 완료")
     
@@ -612,15 +890,19 @@ class FileProcessor:
         """리소스를 정리합니다."""
         try:
             # 임시 파일 정리
+            # (DirEntry의 d_type을 사용하므로 항목마다 stat을 따로 호출하지 않음)
             if self.cleanup_temp_files:
-                temp_path = Path(self.temp_directory)
-                if temp_path.exists():
-                    for temp_file in temp_path.glob('*'):
-                        try:
-                            if temp_file.is_file():
-                                temp_file.unlink()
-                        except Exception as e:
-                            self.logger.warning(f"임시 파일 삭제 실패: {temp_file} - {str(e)}")
+                try:
+                    with os.scandir(self.temp_directory) as entries:
+                        for entry in entries:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            try:
+                                os.unlink(entry.path)
+                            except OSError as e:
+                                self.logger.warning(f"임시 파일 삭제 실패: {entry.path} - {str(e)}")
+                except FileNotFoundError:
+                    pass
             
             self.logger.info("리소스 정리 완료")
             
@@ -0,0 +1,103 @@
+"""
+폴더 감시 서비스
+기본 폴더 바로 아래에 새 폴더가 생기면 (inotify 이벤트) 디바운스 후 콜백을 호출합니다.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+# 프로젝트 루트를 Python 경로에 추가
+import sys
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.logger import LoggerManager
+
+
+class _NewFolderHandler(FileSystemEventHandler):
+    """폴더 생성/이동 이벤트만 감시 서비스로 전달하는 핸들러"""
+    
+    def __init__(self, watcher: 'FolderWatcher'):
+        self.watcher = watcher
+    
+    def on_created(self, event):
+        if event.is_directory:
+            self.watcher._schedule_callback()
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            self.watcher._schedule_callback()
+
+
+class FolderWatcher:
+    """기본 폴더의 새 하위 폴더 생성을 감시하는 서비스"""
+    
+    def __init__(self, base_folders: List[str], on_change: Callable[[], None], debounce_sec: float = 0.5):
+        # 로거 설정
+        self.logger_manager = LoggerManager()
+        self.logger = self.logger_manager.get_logger(__name__)
+        
+        self.base_folders = base_folders
+        self.on_change = on_change
+        self.debounce_sec = debounce_sec
+        
+        # 하위 폴더까지 재귀 감시하지 않고 기본 폴더 바로 아래만 감시
+        self.observer = Observer()
+        self.event_handler = _NewFolderHandler(self)
+        
+        # 디바운스 타이머 (이벤트가 몰려도 구간당 콜백은 한 번)
+        self._timer_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        
+        self.is_running = False
+    
+    def start(self):
+        """폴더 감시를 시작합니다."""
+        if self.is_running:
+            return
+        
+        for base_folder in self.base_folders:
+            self.observer.schedule(self.event_handler, str(base_folder), recursive=False)
+        
+        self.observer.start()
+        self.is_running = True
+        self.logger.info("폴더 감시 시작: %d개 기본 폴더", len(self.base_folders))
+    
+    def stop(self):
+        """폴더 감시를 중지합니다."""
+        if not self.is_running:
+            return
+        
+        self.observer.stop()
+        self.observer.join()
+        
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        
+        self.is_running = False
+        self.logger.info("폴더 감시 중지")
+    
+    def _schedule_callback(self):
+        """디바운스 구간이 끝나면 콜백이 호출되도록 예약합니다. (이미 예약되어 있으면 무시)"""
+        with self._timer_lock:
+            if self._timer is not None:
+                return
+            
+            self._timer = threading.Timer(self.debounce_sec, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _fire(self):
+        """예약된 콜백을 실행합니다."""
+        with self._timer_lock:
+            self._timer = None
+        
+        try:
+            self.on_change()
+        except Exception as e:
+            self.logger.error("폴더 변경 처리 실패: %s", e)
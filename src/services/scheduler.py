@@ -5,9 +5,13 @@
 
 import time
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import select, func, update, bindparam
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor as JobThreadPoolExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
@@ -20,11 +24,23 @@ sys.path.insert(0, str(project_root))
 
 from src.utils.logger import LoggerManager
 from src.services.file_monitor import FileMonitorService
+from src.services.folder_watcher import FolderWatcher
 from src.db.connection import DatabaseManager
 from src.models.file_info import FileInfo
-from src.uploader.service import uploader_service
+from src.uploader.service import UploaderService
 from config.settings import get_config
 
+# 업로드 대기 파일 페이지 크기
+_PENDING_PAGE_SIZE = 200
+
+# 업로드 대기 파일 조회문 (매 실행마다 새로 만들지 않고 재사용, id 기준 키셋 페이지 단위로 조회)
+_PENDING_PAGE_STMT = (
+    select(FileInfo)
+    .where(FileInfo.processing_status == 'pending', FileInfo.id > bindparam('after_id'))
+    .order_by(FileInfo.id)
+    .limit(_PENDING_PAGE_SIZE)
+)
+
 
 class MonitoringScheduler:
     """파일 모니터링을 위한 스케줄러 서비스"""
@@ -49,13 +65,50 @@ class MonitoringScheduler:
         self.enable_periodic_scan = self.scheduler_config.get('enable_periodic_scan', True)
         self.enable_health_check = self.scheduler_config.get('enable_health_check', True)
         self.enable_cleanup = self.scheduler_config.get('enable_cleanup', True)
+        self.upload_concurrency = self.scheduler_config.get('upload_concurrency', 8)
+        # 동시에 제출해 둘 업로드 수 (실행 중 + 작업자 풀 대기, 기본값은 작업자 수)
+        self.upload_max_in_flight = self.scheduler_config.get('upload_max_in_flight', self.upload_concurrency)
+        self.job_pool_size = self.scheduler_config.get('job_pool_size', 20)
+        self.use_inotify = self.scheduler_config.get('use_inotify', True)
+        
+        # 새 날짜 폴더 감시 (Linux에서 use_inotify 설정 시 폴링 작업 대신 사용)
+        self.folder_watcher: Optional[FolderWatcher] = None
+        
+        # 작업자 스레드마다 파일 단위로 호출되는 업로드 함수 (속성 조회를 한 번만 수행)
+        self._upload_and_record = UploaderService(pool_size=self.upload_concurrency).upload_and_record
+        
+        # 업로드 대기 파일 처리용 작업자 풀 (작업 실행마다 새로 만들지 않고 재사용, 중지 후 시작 시 재생성)
+        self._upload_executor: Optional[ThreadPoolExecutor] = self._create_upload_executor()
+        
+        # 상태 점검용 파일 개수 캐시 (TTL 내에는 전체 개수를 다시 세지 않음)
+        self._file_count_ttl = 300
+        self._cached_file_count: Optional[int] = None
+        self._cached_file_count_ts = 0.0
+        
+        # 업로드 대기 파일 카운터 (0이면 조회를 건너뛰고, 주기적으로 DB와 다시 맞춤)
+        # notify_pending_added를 호출하는 생산자가 연결되기 전에는 카운터를 믿을 수 없으므로 매 실행마다 조회
+        self._pending_lock = threading.Lock()
+        self._pending_count = 0
+        self._pending_tracked = False
+        self._pending_reconcile_interval = 3600
+        self._last_pending_reconcile: Optional[float] = None
+        
+        # get_status 결과 캐시 (짧은 주기의 반복 조회 시 작업 정보를 다시 계산하지 않음)
+        self._status_cache: Optional[Dict] = None
+        self._status_cache_ts = 0.0
+        self._status_cache_ttl = 1.0
         
         # APScheduler 인스턴스
+        # 긴 파일 스캔은 전용 실행기에서 돌려 다른 작업의 실행 슬롯을 점유하지 않도록 함
         self.scheduler = BackgroundScheduler(
+            executors={
+                'default': JobThreadPoolExecutor(self.job_pool_size),
+                'scan': JobThreadPoolExecutor(1)
+            },
             job_defaults={
                 'coalesce': True,
                 'max_instances': 1,
-                'misfire_grace_time': 60
+                'misfire_grace_time': 300
             }
         )
         
@@ -84,7 +137,7 @@ class MonitoringScheduler:
         job = self.scheduler.get_job(job_id)
         
         if job:
-            self.logger.debug(f"작업 실행 완료: {job_id} - {job.name}")
+            self.logger.debug("작업 실행 완료: %s - %s", job_id, job.name)
             
             # 콜백 함수 호출
             if self.on_scan_complete_callback:
@@ -102,8 +155,8 @@ class MonitoringScheduler:
         job = self.scheduler.get_job(job_id)
         exception = event.exception
         
-        self.logger.error(f"작업 실행 오류: {job_id} - {job.name if job else 'Unknown'}")
-        self.logger.error(f"오류 내용: {str(exception)}")
+        self.logger.error("작업 실행 오류: %s - %s", job_id, job.name if job else 'Unknown')
+        self.logger.error("오류 내용: %s", exception)
         
         # 콜백 함수 호출
         if self.on_error_callback:
@@ -116,8 +169,14 @@ class MonitoringScheduler:
             if self.enable_periodic_scan:
                 self._add_periodic_scan_job()
             
-            # 새로운 날짜 폴더 확인 작업
-            self._add_check_new_folders_job()
+            # 새로운 날짜 폴더 확인 (inotify 감시를 사용할 수 없으면 주기 작업으로 대체)
+            if self.use_inotify and sys.platform == 'linux':
+                self.folder_watcher = FolderWatcher(
+                    self.file_monitor.base_folders,
+                    self.file_monitor.check_and_update_monitored_folders
+                )
+            else:
+                self._add_check_new_folders_job()
             
             # 업로드 대기 중인 파일 처리 작업
             self._add_process_pending_uploads_job()
@@ -130,12 +189,23 @@ class MonitoringScheduler:
             if self.enable_cleanup:
                 self._add_cleanup_job()
             
+            self._invalidate_status_cache()
             self.logger.info("스케줄러 작업 등록 완료")
             
         except Exception as e:
-            self.logger.error(f"스케줄러 작업 등록 실패: {str(e)}")
+            self.logger.error("스케줄러 작업 등록 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
     
+    def _staggered_start_date(self, phase: int) -> datetime:
+        """
+        같은 주기로 도는 작업들이 동시에 실행되지 않도록 주기를 3등분한 위상만큼 시작 시점을 늦춥니다.
+        
+        Args:
+            phase: 위상 순번 (0, 1, 2)
+        """
+        phase_seconds = self.scan_interval * 60 / 3
+        return datetime.now() + timedelta(seconds=5 + phase * phase_seconds)
+    
     def _add_periodic_scan_job(self):
         """주기적 파일 스캔 작업을 추가합니다."""
         job_id = 'periodic_file_scan'
@@ -143,7 +213,7 @@ class MonitoringScheduler:
         # 분 단위로 실행
         trigger = IntervalTrigger(
             minutes=self.scan_interval,
-            start_date=datetime.now() + timedelta(seconds=10)  # 10초 후 시작
+            start_date=self._staggered_start_date(1)  # 주기의 1/3 지점
         )
         
         job = self.scheduler.add_job(
@@ -151,11 +221,12 @@ class MonitoringScheduler:
             trigger=trigger,
             id=job_id,
             name='주기적 파일 스캔',
+            executor='scan',
             replace_existing=True
         )
         
         self.jobs[job_id] = job
-        self.logger.info(f"주기적 파일 스캔 작업 등록: {self.scan_interval}분마다 실행")
+        self.logger.info("주기적 파일 스캔 작업 등록: %s분마다 실행", self.scan_interval)
     
     def _add_check_new_folders_job(self):
         """새로운 날짜 폴더 확인 작업을 추가합니다."""
@@ -164,7 +235,7 @@ class MonitoringScheduler:
         # 분 단위로 실행
         trigger = IntervalTrigger(
             minutes=self.scan_interval,
-            start_date=datetime.now() + timedelta(seconds=5)  # 5초 후 시작
+            start_date=self._staggered_start_date(0)  # 5초 후 시작
         )
         
         job = self.scheduler.add_job(
@@ -176,7 +247,7 @@ class MonitoringScheduler:
         )
         
         self.jobs[job_id] = job
-        self.logger.info(f"새로운 날짜 폴더 확인 작업 등록: {self.scan_interval}분마다 실행")
+        self.logger.info("새로운 날짜 폴더 확인 작업 등록: %s분마다 실행", self.scan_interval)
     
     def _add_process_pending_uploads_job(self):
         """업로드 대기 중인 파일 처리 작업을 추가합니다."""
@@ -185,7 +256,7 @@ class MonitoringScheduler:
         # 분 단위로 실행
         trigger = IntervalTrigger(
             minutes=self.scan_interval,
-            start_date=datetime.now() + timedelta(seconds=15)  # 15초 후 시작
+            start_date=self._staggered_start_date(2)  # 주기의 2/3 지점
         )
         
         job = self.scheduler.add_job(
@@ -197,7 +268,7 @@ class MonitoringScheduler:
         )
         
         self.jobs[job_id] = job
-        self.logger.info(f"업로드 대기 중인 파일 처리 작업 등록: {self.scan_interval}분마다 실행")
+        self.logger.info("업로드 대기 중인 파일 처리 작업 등록: %s분마다 실행", self.scan_interval)
     
     def _add_health_check_job(self):
         """상태 점검 작업을 추가합니다."""
@@ -235,6 +306,13 @@ class MonitoringScheduler:
         self.jobs[job_id] = job
         self.logger.info("정리 작업 등록: 매일 새벽 2시 실행")
     
+    def _create_upload_executor(self) -> ThreadPoolExecutor:
+        """업로드 대기 파일 처리용 작업자 풀을 생성합니다."""
+        return ThreadPoolExecutor(
+            max_workers=self.upload_concurrency,
+            thread_name_prefix='PendingUpload'
+        )
+    
     def start(self):
         """스케줄러를 시작합니다."""
         if self.is_running:
@@ -244,17 +322,31 @@ class MonitoringScheduler:
         try:
             self.logger.info("스케줄러 시작")
             
+            # 중지 후 다시 시작하는 경우 업로드 작업자 풀 재생성
+            if self._upload_executor is None:
+                self._upload_executor = self._create_upload_executor()
+            
             # 스케줄러 시작
             self.scheduler.start()
             self.is_running = True
             
+            # 폴더 감시 시작 (실패 시 주기 작업으로 대체)
+            if self.folder_watcher:
+                try:
+                    self.folder_watcher.start()
+                except Exception as e:
+                    self.logger.warning("폴더 감시 시작 실패, 주기 확인 작업으로 대체: %s", e)
+                    self.folder_watcher = None
+                    self._add_check_new_folders_job()
+            self._invalidate_status_cache()
+            
             # 등록된 작업 정보 출력
             self._log_job_info()
             
             self.logger.info("✅ 스케줄러 시작 완료")
             
         except Exception as e:
-            self.logger.error(f"스케줄러 시작 실패: {str(e)}")
+            self.logger.error("스케줄러 시작 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             raise
     
@@ -268,18 +360,34 @@ class MonitoringScheduler:
             self.logger.info("스케줄러 중지")
             
             # 스케줄러 중지
+            if self.folder_watcher:
+                self.folder_watcher.stop()
             self.scheduler.shutdown(wait=True)
+            if self._upload_executor:
+                self._upload_executor.shutdown(wait=True)
+                self._upload_executor = None
             self.is_running = False
+            self._invalidate_status_cache()
             
             self.logger.info("✅ 스케줄러 중지 완료")
             
         except Exception as e:
-            self.logger.error(f"스케줄러 중지 실패: {str(e)}")
+            self.logger.error("스케줄러 중지 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             raise
     
+    @contextmanager
+    def _job_session(self):
+        """작업 한 번의 실행 동안 공유할 데이터베이스 세션을 제공합니다."""
+        session = self.db_manager.get_session()
+        try:
+            yield session
+        finally:
+            session.close()
+    
     def _periodic_file_scan(self):
         """주기적으로 파일을 스캔합니다."""
+        now = datetime.now()
         try:
             self.logger.info("주기적 파일 스캔 시작")
             start_time = time.time()
@@ -288,31 +396,33 @@ class MonitoringScheduler:
             self.file_monitor.scan_existing_files()
             
             # 스캔 결과 통계
-            scan_stats = self._get_scan_statistics()
+            with self._job_session() as session:
+                scan_stats = self._get_scan_statistics(session)
             
             execution_time = time.time() - start_time
-            self.logger.info(f"주기적 파일 스캔 완료 (소요시간: {execution_time:.2f}초)")
-            self.logger.info(f"스캔 통계: {scan_stats}")
+            self.logger.info("주기적 파일 스캔 완료 (소요시간: %.2f초)", execution_time)
+            self.logger.info("스캔 통계: %s", scan_stats)
             
             return {
                 'status': 'success',
                 'execution_time': execution_time,
                 'scan_stats': scan_stats,
-                'timestamp': datetime.now()
+                'timestamp': now
             }
             
         except Exception as e:
-            self.logger.error(f"주기적 파일 스캔 실패: {str(e)}")
+            self.logger.error("주기적 파일 스캔 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.now()
+                'timestamp': now
             }
     
     def _health_check(self):
         """모니터링 상태를 점검합니다."""
+        now = datetime.now()
         try:
             self.logger.info("모니터링 상태 점검 시작")
             
@@ -320,7 +430,8 @@ class MonitoringScheduler:
             monitor_status = self.file_monitor.get_monitoring_status()
             
             # 데이터베이스 연결 상태 확인
-            db_status = self._check_database_health()
+            with self._job_session() as session:
+                db_status = self._check_database_health(session)
             
             # 전체 상태 점검
             health_status = {
@@ -331,7 +442,7 @@ class MonitoringScheduler:
                     'job_count': len(self.jobs),
                     'next_run': self._get_next_run_times()
                 },
-                'timestamp': datetime.now()
+                'timestamp': now
             }
             
             # 상태 로깅
@@ -347,159 +458,228 @@ class MonitoringScheduler:
             return health_status
             
         except Exception as e:
-            self.logger.error(f"상태 점검 실패: {str(e)}")
+            self.logger.error("상태 점검 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.now()
+                'timestamp': now
             }
     
+    def notify_pending_added(self, count: int = 1):
+        """업로드 대기 상태로 기록된 파일이 생겼음을 알립니다."""
+        with self._pending_lock:
+            self._pending_count += count
+            self._pending_tracked = True
+    
     def process_pending_uploads(self):
         """업로드 대기 중인 파일을 처리합니다."""
+        # 카운터가 연결된 상태에서 알려진 대기 파일이 없고 재확인 주기가 지나지 않았으면 DB 조회 생략
+        # (첫 실행은 항상 조회)
+        tick = time.monotonic()
+        with self._pending_lock:
+            pending_hint = self._pending_count
+            tracked = self._pending_tracked
+        if (
+            tracked
+            and pending_hint == 0
+            and self._last_pending_reconcile is not None
+            and tick - self._last_pending_reconcile < self._pending_reconcile_interval
+        ):
+            return {
+                'status': 'skipped',
+                'processed_count': 0,
+                'message': '업로드 대기 중인 파일 없음'
+            }
+        
+        now = datetime.now()
         try:
             self.logger.info("업로드 대기 중인 파일 확인 및 처리 시작...")
             
-            # PENDING 상태의 파일 조회
-            session = self.db_manager.get_session()
-            try:
-                pending_files = session.query(FileInfo).filter(
-                    FileInfo.processing_status == 'pending'
-                ).all()
-                
-                if not pending_files:
-                    self.logger.info("업로드 대기 중인 파일 없음.")
-                    return {
-                        'status': 'success',
-                        'processed_count': 0,
-                        'message': '업로드 대기 중인 파일 없음'
-                    }
+            # PENDING 상태의 파일을 키셋 페이지로 나눠 읽으면서 바로 작업자 풀에 제출
+            # (페이지는 세션을 닫기 전에 모두 읽어 둠: 일부만 읽은 커서가 SQLite 공유 잠금을 쥔 채로
+            # 업로드를 기다리면 업로드 결과 기록 커밋이 "database is locked"로 실패함)
+            executor = self._upload_executor
+            if executor is None:
+                raise RuntimeError("스케줄러가 중지되어 업로드 작업자 풀을 사용할 수 없습니다.")
+            
+            # 루프 안에서 반복되는 속성 조회를 지역 변수로 고정
+            submit = executor.submit
+            upload_file = self._upload_pending_file
+            in_flight = threading.BoundedSemaphore(self.upload_max_in_flight)
+            release = lambda _future: in_flight.release()
+            futures = []
+            add_future = futures.append
+            
+            after_id = 0
+            while True:
+                with self._job_session() as session:
+                    page = session.scalars(_PENDING_PAGE_STMT, {'after_id': after_id}).all()
                 
-                self.logger.info(f"업로드 대기 중인 파일 {len(pending_files)}개 발견")
-                
-                # 각 파일에 대해 업로드 시도
-                processed_count = 0
-                for file_obj in pending_files:
-                    try:
-                        self.logger.info(f"업로드 대기 중인 파일 처리: {file_obj.file_name}")
-                        result = uploader_service.upload_and_record(file_obj)
-                        
-                        if result:
-                            self.logger.info(f"파일 업로드 성공: {file_obj.file_name}")
-                        else:
-                            self.logger.warning(f"파일 업로드 실패: {file_obj.file_name}")
-                        
-                        processed_count += 1
-                        
-                    except Exception as e:
-                        self.logger.error(f"파일 업로드 처리 중 오류: {file_obj.file_name} - {str(e)}")
-                        continue
-                
-                self.logger.info(f"업로드 대기 중인 파일 처리 완료: {processed_count}/{len(pending_files)}개 처리됨")
+                # 배치 단위로 끝나기를 기다리지 않고, 진행 중인 업로드가 upload_max_in_flight개 미만이 될 때마다 다음 파일 제출
+                # (느린 업로드 하나가 배치 전체를 붙잡지 않으며, 스레드 수는 작업자 풀 크기로 고정)
+                for file_obj in page:
+                    in_flight.acquire()
+                    future = submit(upload_file, file_obj)
+                    future.add_done_callback(release)
+                    add_future(future)
                 
+                if len(page) < _PENDING_PAGE_SIZE:
+                    break
+                after_id = page[-1].id
+            
+            results = [future.result() for future in futures]
+            total_count = len(results)
+            processed_count = sum(1 for result in results if result is not None)
+            succeeded_count = sum(1 for result in results if result)
+            
+            # 조회 시점까지 알려진 대기 파일은 모두 처리 대상에 포함되었으므로 카운터에서 차감
+            with self._pending_lock:
+                self._pending_count = max(0, self._pending_count - pending_hint)
+            self._last_pending_reconcile = tick
+            
+            if processed_count:
+                self._invalidate_file_count()
+            
+            if not total_count:
+                self.logger.info("업로드 대기 중인 파일 없음.")
                 return {
                     'status': 'success',
-                    'processed_count': processed_count,
-                    'total_count': len(pending_files),
-                    'timestamp': datetime.now()
+                    'processed_count': 0,
+                    'message': '업로드 대기 중인 파일 없음'
                 }
-                
-            finally:
-                session.close()
-                
+            
+            self.logger.info(
+                "업로드 대기 중인 파일 처리 완료: 성공 %d개, 실패 %d개 (전체 %d개)",
+                succeeded_count, total_count - succeeded_count, total_count
+            )
+            
+            return {
+                'status': 'success',
+                'processed_count': processed_count,
+                'succeeded_count': succeeded_count,
+                'total_count': total_count,
+                'timestamp': now
+            }
+            
         except Exception as e:
-            self.logger.error(f"업로드 대기 중인 파일 처리 실패: {str(e)}")
+            self.logger.error("업로드 대기 중인 파일 처리 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.now()
+                'timestamp': now
             }
     
+    def _upload_pending_file(self, file_obj: FileInfo) -> Optional[bool]:
+        """업로드 대기 파일 하나를 업로드합니다. (작업자 풀에서 실행, 예외 발생 시 None 반환)"""
+        try:
+            success = self._upload_and_record(file_obj)
+            self.logger.debug("업로드 대기 파일 처리: %s (%s)", file_obj.file_name, '성공' if success else '실패')
+            return success
+        except Exception as e:
+            self.logger.error("파일 업로드 처리 중 오류: %s - %s", file_obj.file_name, e)
+            return None
+    
     def _cleanup_old_records(self):
         """오래된 레코드를 정리합니다."""
+        now = datetime.now()
         try:
             self.logger.info("오래된 레코드 정리 시작")
             
             # 설정에서 보관 기간 가져오기
             retention_days = self.config.get('database', {}).get('retention_days', 90)
-            cutoff_date = datetime.now() - timedelta(days=retention_days)
+            cutoff_date = now - timedelta(days=retention_days)
             
             # 데이터베이스 세션 생성
-            session = self.db_manager.get_session()
-            
-            try:
-                # 오래된 파일 정보 삭제
-                old_file_infos = session.query(FileInfo).filter(
-                    FileInfo.scan_date < cutoff_date,
-                    FileInfo.is_deleted == False
-                ).all()
-                
-                deleted_file_count = 0
-                for file_info in old_file_infos:
-                    file_info.delete(session)
-                    deleted_file_count += 1
-                
-                # 오래된 업로드 결과 삭제 (선택적)
-                cleanup_upload_results = self.config.get('database', {}).get('cleanup_upload_results', False)
-                if cleanup_upload_results:
-                    from src.models.upload_result import UploadResult
-                    old_upload_results = session.query(UploadResult).filter(
-                        UploadResult.created_at < cutoff_date,
-                        UploadResult.is_deleted == False
-                    ).all()
+            with self._job_session() as session:
+                # 10000건 단위로 소프트 삭제하고 묶음마다 커밋 (긴 트랜잭션 방지, 중단되어도 진행분 유지)
+                deleted_at = datetime.utcnow()
+                with session.no_autoflush:
+                    # 오래된 파일 정보 삭제
+                    deleted_file_count = self._soft_delete_in_chunks(
+                        session, FileInfo, deleted_at,
+                        FileInfo.scan_date < cutoff_date
+                    )
                     
-                    deleted_upload_count = 0
-                    for upload_result in old_upload_results:
-                        upload_result.delete(session)
-                        deleted_upload_count += 1
-                    
-                    self.logger.info(f"오래된 업로드 결과 {deleted_upload_count}개 삭제")
+                    # 오래된 업로드 결과 삭제 (선택적)
+                    cleanup_upload_results = self.config.get('database', {}).get('cleanup_upload_results', False)
+                    if cleanup_upload_results:
+                        from src.models.upload_result import UploadResult
+                        deleted_upload_count = self._soft_delete_in_chunks(
+                            session, UploadResult, deleted_at,
+                            UploadResult.created_at < cutoff_date
+                        )
+                        
+                        self.logger.info("오래된 업로드 결과 %s개 삭제", deleted_upload_count)
                 
-                self.logger.info(f"오래된 파일 정보 {deleted_file_count}개 삭제 완료")
+                self._invalidate_file_count()
+                
+                self.logger.info("오래된 파일 정보 %s개 삭제 완료", deleted_file_count)
                 
                 return {
                     'status': 'success',
                     'deleted_file_count': deleted_file_count,
                     'retention_days': retention_days,
-                    'timestamp': datetime.now()
+                    'timestamp': now
                 }
                 
-            finally:
-                session.close()
-                
         except Exception as e:
-            self.logger.error(f"오래된 레코드 정리 실패: {str(e)}")
+            self.logger.error("오래된 레코드 정리 실패: %s", e)
             self.logger.exception("상세 에러 정보:")
             
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.now()
+                'timestamp': now
             }
     
-    def _check_database_health(self) -> Dict:
+    def _soft_delete_in_chunks(self, session, model, deleted_at: datetime, *criteria, chunk_size: int = 10000) -> int:
+        """
+        조건에 맞는 레코드를 기본 키 묶음 단위의 UPDATE로 소프트 삭제하고 삭제된 개수를 반환합니다.
+        
+        처리된 행은 is_deleted 조건에서 빠지므로 매번 다음 묶음을 다시 조회합니다.
+        UPDATE ... LIMIT 지원이 DB마다 달라 id 조회 후 IN 조건으로 갱신하며, 묶음마다 커밋합니다.
+        """
+        deleted_count = 0
+        
+        while True:
+            ids = session.execute(
+                select(model.id)
+                .where(*criteria, model.is_deleted == False)
+                .limit(chunk_size)
+            ).scalars().all()
+            if not ids:
+                break
+            
+            session.execute(
+                update(model)
+                .where(model.id.in_(ids))
+                .values(is_deleted=True, deleted_at=deleted_at)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            deleted_count += len(ids)
+            
+            if len(ids) < chunk_size:
+                break
+        
+        return deleted_count
+    
+    def _check_database_health(self, session) -> Dict:
         """데이터베이스 상태를 점검합니다."""
         try:
             # 연결 테스트
             connected = self.db_manager.test_connection()
             
             if connected:
-                # 간단한 쿼리 테스트
-                session = self.db_manager.get_session()
-                try:
-                    # 파일 개수 조회
-                    file_count = session.query(FileInfo).count()
-                    
-                    return {
-                        'connected': True,
-                        'file_count': file_count,
-                        'status': 'healthy'
-                    }
-                finally:
-                    session.close()
+                return {
+                    'connected': True,
+                    'file_count': self._get_cached_file_count(session),
+                    'status': 'healthy'
+                }
             else:
                 return {
                     'connected': False,
@@ -513,49 +693,54 @@ class MonitoringScheduler:
                 'error': str(e)
             }
     
-    def _get_scan_statistics(self) -> Dict:
+    def _get_cached_file_count(self, session) -> int:
+        """파일 개수를 반환합니다. (TTL 동안 캐시, 레코드 변경 작업 후 무효화)"""
+        now = time.monotonic()
+        if self._cached_file_count is not None and now - self._cached_file_count_ts < self._file_count_ttl:
+            return self._cached_file_count
+        
+        self._cached_file_count = session.scalar(select(func.count()).select_from(FileInfo)) or 0
+        self._cached_file_count_ts = now
+        return self._cached_file_count
+    
+    def _invalidate_file_count(self):
+        """캐시된 파일 개수를 무효화합니다."""
+        self._cached_file_count = None
+    
+    def _get_scan_statistics(self, session) -> Dict:
         """스캔 통계 정보를 반환합니다."""
         try:
-            session = self.db_manager.get_session()
+            # 전체/상태별/폴더별 파일 개수를 조건부 집계 한 번으로 조회
+            statuses = ('new', 'processing', 'processed', 'error')
+            folder_names = ('Sega_1', 'Sega_2', 'Sega_3')
+            
+            stmt = select(
+                func.count(),
+                *(func.count().filter(FileInfo.processing_status == status, FileInfo.is_deleted == False)
+                  for status in statuses),
+                *(func.count().filter(FileInfo.folder_name == folder_name)
+                  for folder_name in folder_names)
+            ).select_from(FileInfo)
+            row = session.execute(stmt).one()
+            
+            total_files = row[0]
+            status_counts = dict(zip(statuses, row[1:1 + len(statuses)]))
+            folder_counts = dict(zip(folder_names, row[1 + len(statuses):]))
+            
+            return {
+                'total_files': total_files,
+                'status_counts': status_counts,
+                'folder_counts': folder_counts
+            }
             
-            try:
-                # 전체 파일 개수
-                total_files = session.query(FileInfo).count()
-                
-                # 상태별 파일 개수
-                status_counts = FileInfo.get_file_count_by_status(session)
-                
-                # 폴더별 파일 개수
-                folder_counts = {}
-                for folder_name in ['Sega_1', 'Sega_2', 'Sega_3']:
-                    count = session.query(FileInfo).filter(
-                        FileInfo.folder_name == folder_name
-                    ).count()
-                    folder_counts[folder_name] = count
-                
-                return {
-                    'total_files': total_files,
-                    'status_counts': status_counts,
-                    'folder_counts': folder_counts
-                }
-                
-            finally:
-                session.close()
-                
         except Exception as e:
-            self.logger.error(f"스캔 통계 수집 실패: {str(e)}")
+            self.logger.error("스캔 통계 수집 실패: %s", e)
             return {'error': str(e)}
     
     def _get_job_next_run(self, job) -> str:
         """작업의 다음 실행 시간을 안전하게 가져옵니다."""
-        try:
-            next_run = job.next_run_time
-            if next_run:
-                return next_run.isoformat()
-            else:
-                return 'Not scheduled'
-        except AttributeError:
-            return 'Unknown'
+        next_run = getattr(job, 'next_run_time', None)
+        return next_run.isoformat() if next_run else 'Not scheduled'
     
     def _get_next_run_times(self) -> Dict:
         """다음 실행 시간들을 반환합니다."""
@@ -570,12 +755,7 @@ class MonitoringScheduler:
         """등록된 작업 정보를 로깅합니다."""
         self.logger.info("등록된 스케줄러 작업:")
         for job_id, job in self.jobs.items():
-            try:
-                next_run = job.next_run_time
-                next_run_str = next_run.isoformat() if next_run else 'Not scheduled'
-                self.logger.info(f"  - {job_id}: {job.name} (다음 실행: {next_run_str})")
-            except AttributeError:
-                self.logger.info(f"  - {job_id}: {job.name} (다음 실행: Unknown)")
+            self.logger.info("  - %s: %s (다음 실행: %s)", job_id, job.name, self._get_job_next_run(job))
     
     def _log_health_status(self, health_status: Dict):
         """상태 점검 결과를 로깅합니다."""
@@ -584,16 +764,20 @@ class MonitoringScheduler:
         scheduler_status = health_status['scheduler']
         
         self.logger.info("모니터링 상태 점검 결과:")
-        self.logger.info(f"  - 파일 모니터: {'실행 중' if monitor_status['is_monitoring'] else '중지됨'}")
-        self.logger.info(f"  - 데이터베이스: {'연결됨' if db_status['connected'] else '연결 안됨'}")
-        self.logger.info(f"  - 스케줄러: {'실행 중' if scheduler_status['is_running'] else '중지됨'}")
+        self.logger.info("  - 파일 모니터: %s", '실행 중' if monitor_status['is_monitoring'] else '중지됨')
+        self.logger.info("  - 데이터베이스: %s", '연결됨' if db_status['connected'] else '연결 안됨')
+        self.logger.info("  - 스케줄러: %s", '실행 중' if scheduler_status['is_running'] else '중지됨')
         
         if db_status['connected'] and 'file_count' in db_status:
-            self.logger.info(f"  - 총 파일 수: {db_status['file_count']}")
+            self.logger.info("  - 총 파일 수: %s", db_status['file_count'])
     
     def get_status(self) -> Dict:
-        """스케줄러 상태 정보를 반환합니다."""
-        return {
+        """스케줄러 상태 정보를 반환합니다. (1초 동안 캐시)"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache_ts < self._status_cache_ttl:
+            return self._status_cache
+        
+        self._status_cache = {
             'is_running': self.is_running,
             'job_count': len(self.jobs),
             'jobs': {job_id: {
@@ -608,6 +792,12 @@ class MonitoringScheduler:
                 'enable_cleanup': self.enable_cleanup
             }
         }
+        self._status_cache_ts = now
+        return self._status_cache
+    
+    def _invalidate_status_cache(self):
+        """캐시된 스케줄러 상태를 무효화합니다."""
+        self._status_cache = None
     
     def set_scan_complete_callback(self, callback: Callable[[Dict], None]):
         """스캔 완료 시 호출될 콜백 함수를 설정합니다."""
@@ -625,11 +815,12 @@ class MonitoringScheduler:
             job = self.scheduler.get_job(job_id)
             if job:
                 job.pause()
-                self.logger.info(f"작업 일시 중지: {job_id}")
+                self._invalidate_status_cache()
+                self.logger.info("작업 일시 중지: %s", job_id)
             else:
-                self.logger.warning(f"작업을 찾을 수 없습니다: {job_id}")
+                self.logger.warning("작업을 찾을 수 없습니다: %s", job_id)
         except Exception as e:
-            self.logger.error(f"작업 일시 중지 실패: {str(e)}")
+            self.logger.error("작업 일시 중지 실패: %s", e)
     
     def resume_job(self, job_id: str):
         """일시 중지된 작업을 재개합니다."""
@@ -637,11 +828,12 @@ class MonitoringScheduler:
             job = self.scheduler.get_job(job_id)
             if job:
                 job.resume()
-                self.logger.info(f"작업 재개: {job_id}")
+                self._invalidate_status_cache()
+                self.logger.info("작업 재개: %s", job_id)
             else:
-                self.logger.warning(f"작업을 찾을 수 없습니다: {job_id}")
+                self.logger.warning("작업을 찾을 수 없습니다: %s", job_id)
         except Exception as e:
-            self.logger.error(f"작업 재개 실패: {str(e)}")
+            self.logger.error("작업 재개 실패: %s", e)
 
 
 # 테스트 코드
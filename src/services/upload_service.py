@@ -4,19 +4,21 @@ API 클라이언트와 파일 처리 시스템을 연동하여 파일 업로드
 """
 
 import time
+import logging
+import logging.handlers
+import heapq
+import itertools
 import threading
-from datetime import datetime
+import multiprocessing
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Union
-from queue import Queue, Empty
-from dataclasses import dataclass
+from queue import Queue, PriorityQueue, Empty
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from enum import Enum
 
-# 프로젝트 루트를 Python 경로에 추가
-import sys
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
+# 프로젝트 루트 기준 절대 경로로 가져옴 (직접 실행 시: python -m src.services.upload_service)
 from src.utils.logger import LoggerManager
 from src.services.api_client import APIClient
 from src.models.upload_result import UploadResult
@@ -24,6 +26,39 @@ from src.db.connection import DatabaseManager
 from config.settings import get_config
 
 
+# 업로드 프로세스 풀 작업자의 API 클라이언트 (작업자 프로세스마다 하나, HTTP 세션 재사용)
+_worker_api_client: Optional[APIClient] = None
+
+
+def _init_upload_process(log_queue, logger_name: str, log_level: int):
+    """업로드 프로세스 풀 작업자를 초기화합니다."""
+    global _worker_api_client
+    # 작업자 프로세스는 로그 파일/리스너/감시 스레드를 따로 만들지 않고 부모 프로세스로 로그 레코드만 보냄
+    logger = logging.getLogger(f"{logger_name}.process")
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(log_level)
+    logger.propagate = False
+    # 작업자 프로세스는 한 번에 하나씩 업로드하며, 가용성 확인은 부모 프로세스의 클라이언트가 담당
+    _worker_api_client = APIClient(pool_size=1, logger=logger, check_availability=False)
+
+
+class _ForwardingHandler(logging.Handler):
+    """업로드 프로세스 풀 작업자가 보낸 로그 레코드를 이 프로세스의 로거로 넘기는 핸들러"""
+    
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self._logger = logger
+    
+    def emit(self, record: logging.LogRecord):
+        self._logger.handle(record)
+
+
+def _upload_in_process(file_path: str) -> Dict:
+    """업로드 프로세스 풀 작업자에서 파일을 업로드합니다. (경로 문자열만 전달받고 결과 딕셔너리 반환)"""
+    return _worker_api_client.upload_file(file_path)
+
+
 class UploadStatus(Enum):
     """업로드 상태"""
     PENDING = "pending"
@@ -34,38 +69,71 @@ class UploadStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# 완료 시각을 기록하는 최종 상태
+_TERMINAL_STATES = frozenset({UploadStatus.SUCCESS, UploadStatus.FAILED, UploadStatus.CANCELLED})
+
+
+@dataclass(slots=True)
 class UploadTask:
-    """업로드 작업 정보"""
+    """업로드 작업 정보 (__slots__ 사용으로 인스턴스당 메모리 절감)"""
     file_path: Path
     file_info_id: int
     upload_result_id: int
     status: UploadStatus
     priority: int = 0
     created_at: datetime = None
-    updated_at: datetime = None
-    started_at: datetime = None
-    completed_at: datetime = None
+    created_ns: int = field(default=None, repr=False)
+    updated_at: int = None  # time.monotonic_ns() 값 (조회 시 updated_datetime으로 변환)
+    started_at: datetime = None  # 표시용 시각 (최초 업로드 시작 시 created_at 기준으로 한 번만 계산)
+    started_ns: int = field(default=None, repr=False)
+    completed_at: int = None  # time.monotonic_ns() 값 (조회 시 completed_datetime으로 변환)
     retry_count: int = 0
     max_retries: int = 3
     error_message: str = None
     api_response: Dict = None
+    key: str = field(init=False, default=None)  # 활성 업로드 조회 키 (str(file_path), 한 번만 계산)
+    _created_at_iso: str = field(init=False, default=None, repr=False)  # 모니터링 조회용 ISO 문자열 캐시
+    _started_at_iso: str = field(init=False, default=None, repr=False)
     
     def __post_init__(self):
+        self.key = str(self.file_path)
         if self.created_at is None:
             self.created_at = datetime.now()
+        if self.created_ns is None:
+            self.created_ns = time.monotonic_ns()
+        self._created_at_iso = self.created_at.isoformat()
+        if self.started_at is not None:
+            self._started_at_iso = self.started_at.isoformat()
         if self.updated_at is None:
-            self.updated_at = datetime.now()
+            self.updated_at = self.created_ns
+    
+    def _to_datetime(self, ns: int) -> datetime:
+        """monotonic_ns 값을 created_at 기준의 datetime으로 변환합니다."""
+        return self.created_at + timedelta(microseconds=(ns - self.created_ns) // 1000)
+    
+    @property
+    def updated_datetime(self) -> datetime:
+        """마지막 업데이트 시각을 datetime으로 반환합니다."""
+        return self._to_datetime(self.updated_at)
+    
+    @property
+    def completed_datetime(self) -> Optional[datetime]:
+        """완료 시각을 datetime으로 반환합니다. (완료 전이면 None)"""
+        return self._to_datetime(self.completed_at) if self.completed_at is not None else None
     
     def update_status(self, status: UploadStatus, **kwargs):
         """상태를 업데이트합니다."""
+        now = time.monotonic_ns()
         self.status = status
-        self.updated_at = datetime.now()
+        self.updated_at = now
         
-        if status == UploadStatus.UPLOADING and self.started_at is None:
-            self.started_at = datetime.now()
-        elif status in [UploadStatus.SUCCESS, UploadStatus.FAILED, UploadStatus.CANCELLED]:
-            self.completed_at = datetime.now()
+        if status is UploadStatus.UPLOADING:
+            if self.started_at is None:
+                self.started_ns = now
+                self.started_at = self._to_datetime(now)
+                self._started_at_iso = self.started_at.isoformat()
+        elif status in _TERMINAL_STATES:
+            self.completed_at = now
         
         # 추가 필드 업데이트
         for key, value in kwargs.items():
@@ -75,7 +143,7 @@ class UploadTask:
     def increment_retry(self):
         """재시도 횟수를 증가시킵니다."""
         self.retry_count += 1
-        self.updated_at = datetime.now()
+        self.updated_at = time.monotonic_ns()
     
     def can_retry(self) -> bool:
         """재시도 가능한지 확인합니다."""
@@ -93,30 +161,50 @@ class UploadService:
         self.logger_manager = LoggerManager()
         self.logger = self.logger_manager.get_logger(__name__)
         
-        # API 클라이언트
-        self.api_client = APIClient()
-        
-        # 데이터베이스 매니저
-        self.db_manager = DatabaseManager()
-        
         # 업로드 설정
         self.upload_config = self.config.get('upload', {})
         self.max_concurrent_uploads = self.upload_config.get('max_concurrent_uploads', 5)
         self.upload_timeout = self.upload_config.get('timeout_seconds', 60)
         self.retry_delay = self.upload_config.get('retry_delay_seconds', 10)
+        self.use_process_pool = self.upload_config.get('use_process_pool', False)
+        self.priority_aging_sec = self.upload_config.get('priority_aging_seconds', 60)
+        
+        # API 클라이언트 (모든 업로드 작업자가 공유하므로 연결 풀을 동시 업로드 수에 맞춤)
+        self.api_client = APIClient(pool_size=self.max_concurrent_uploads)
+        
+        # 데이터베이스 매니저
+        self.db_manager = DatabaseManager()
         
-        # 업로드 큐
-        self.upload_queue = Queue()
-        self.priority_queue = Queue()
+        # HTTP 요청을 수행할 프로세스 풀 (use_process_pool 설정 시)
+        # 큐, 상태, DB 기록, 콜백은 이 프로세스의 작업자 스레드가 맡고 요청 준비/전송만 작업자 프로세스에서 수행
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_log_listener: Optional[logging.handlers.QueueListener] = None
+        
+        # 업로드 큐 ((정렬 키, 순번, 작업) 순으로 꺼냄, 같은 키는 들어온 순서대로)
+        # 정렬 키는 _queue_key 참고 (대기 시간에 따라 우선순위가 올라가는 효과로 낮은 우선순위 작업의 기아 방지)
+        # 작업을 넣을 때마다 작업자 풀에 실행 요청을 하나씩 제출하고, 실행 시점에 가장 높은 우선순위 작업을 꺼냄
+        self._queue: PriorityQueue = PriorityQueue()
+        self._seq = itertools.count()
+        
+        # 업로드 작업자 풀
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # 업로드 중인 작업들
         self.active_uploads: Dict[str, UploadTask] = {}
         
-        # 스레드 락
+        # 스레드 락 (active_uploads 전용)
         self.upload_lock = threading.Lock()
         
-        # 작업자 스레드들
-        self.upload_threads: List[threading.Thread] = []
+        # 재시도 대기 작업 ((재시도 시각, 순번, 작업) 힙, 전용 스레드가 시각이 되면 큐에 다시 넣음)
+        self._delay_heap: List[tuple] = []
+        self._delay_cond = threading.Condition()
+        self._delay_thread: Optional[threading.Thread] = None
+        
+        # 업로드 결과 DB 기록 큐 (전용 스레드가 모아서 한 세션으로 기록)
+        self._db_write_queue: Queue = Queue()
+        self._db_write_batch_size = 64
+        self._db_write_interval = 0.05  # 초
+        self._db_writer_thread: Optional[threading.Thread] = None
         
         # 시스템 상태
         self.is_running = False
@@ -130,6 +218,7 @@ class UploadService:
             'retry_uploads': 0,
             'pending_uploads': 0
         }
+        self._stats_locks = {name: threading.Lock() for name in self.stats}
         
         # 콜백 함수들
         self.on_upload_started_callback: Optional[Callable[[UploadTask], None]] = None
@@ -137,46 +226,100 @@ class UploadService:
         self.on_upload_failed_callback: Optional[Callable[[UploadTask, str], None]] = None
         self.on_upload_retry_callback: Optional[Callable[[UploadTask, str], None]] = None
         
+        # 콜백 전용 스레드 (느린 콜백이 업로드 작업자를 붙잡지 않도록 분리, 단일 스레드라 호출 순서 유지)
+        self._callback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='UploadCb')
+        
         # 초기화
-        self._start_worker_threads()
-    
-    def _start_worker_threads(self):
-        """업로드 작업자 스레드들을 시작합니다."""
-        for i in range(self.max_concurrent_uploads):
-            thread = threading.Thread(
-                target=self._upload_worker,
-                name=f"UploadWorker-{i}",
-                daemon=True
+        self._start_workers()
+    
+    def _incr_stat(self, name: str, delta: int = 1):
+        """통계 값을 갱신합니다. (항목별 락을 사용해 다른 통계나 활성 업로드 갱신과 경합하지 않음)"""
+        with self._stats_locks[name]:
+            self.stats[name] += delta
+    
+    def _dispatch_callback(self, callback: Callable, *args):
+        """콜백을 콜백 전용 스레드에서 실행하도록 넘깁니다."""
+        try:
+            self._callback_executor.submit(self._run_callback, callback, *args)
+        except RuntimeError:
+            # 콜백 스레드가 이미 종료된 경우 호출한 스레드에서 실행
+            self._run_callback(callback, *args)
+    
+    def _run_callback(self, callback: Callable, *args):
+        """콜백을 실행하고 오류는 로그로만 남깁니다."""
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"업로드 콜백 실행 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
+    
+    def _start_workers(self):
+        """업로드 작업자 풀과 보조 스레드들을 시작합니다."""
+        if self.use_process_pool:
+            # 로깅 리스너, watchdog 감시, DB 기록 스레드가 돌고 있는 프로세스를 fork하면 자식이 복사된 락에서
+            # 멈출 수 있으므로, 깨끗한 forkserver 프로세스에서 작업자를 만듦
+            mp_context = multiprocessing.get_context('forkserver')
+            log_queue = mp_context.Queue()
+            self._process_log_listener = logging.handlers.QueueListener(log_queue, _ForwardingHandler(self.logger))
+            self._process_log_listener.start()
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_concurrent_uploads,
+                mp_context=mp_context,
+                initializer=_init_upload_process,
+                initargs=(log_queue, self.logger.name, self.logger.getEffectiveLevel())
             )
-            thread.start()
-            self.upload_threads.append(thread)
+            self.logger.info(f"업로드 프로세스 풀 시작: {self.max_concurrent_uploads}개")
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_uploads,
+            thread_name_prefix='UploadWorker'
+        )
+        
+        self._start_db_writer()
+        self._start_delay_thread()
+        
+        self.logger.info(f"업로드 작업자 풀 시작 완료: {self.max_concurrent_uploads}개")
+    
+    def _run_next_task(self):
+        """업로드 큐에서 우선순위가 가장 높은 작업을 꺼내 처리합니다. (작업자 풀에서 실행)"""
+        _, _, upload_task = self._queue.get_nowait()
         
-        self.logger.info(f"업로드 작업자 스레드 시작 완료: {len(self.upload_threads)}개")
+        try:
+            self._process_upload(upload_task)
+            
+        except Exception as e:
+            self.logger.error(f"업로드 작업자 오류: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
+        
+        finally:
+            # 작업 완료 표시
+            self._queue.task_done()
+    
+    def _queue_key(self, upload_task: UploadTask) -> float:
+        """
+        업로드 큐 정렬 키를 계산합니다. (작을수록 먼저 처리)
+        
+        큐에 들어온 시각을 priority_aging_sec 단위로 환산해 더하므로, priority_aging_sec만큼 먼저 들어온 작업은
+        우선순위가 1 높은 작업과 같은 순위가 됩니다. 모든 작업이 같은 속도로 나이를 먹으므로 키를 다시 계산할 필요가 없습니다.
+        """
+        if not self.priority_aging_sec:
+            return -upload_task.priority
+        return time.monotonic() / self.priority_aging_sec - upload_task.priority
     
-    def _upload_worker(self):
-        """업로드 작업자 스레드"""
-        while not self.shutdown_event.is_set():
+    def _enqueue(self, upload_task: UploadTask):
+        """
+        이미 만들어진 작업을 우선순위에 맞춰 업로드 큐에 넣고 작업자 풀에 실행을 요청합니다.
+        새 작업과 재시도 작업이 함께 사용하는 경로로, 경로 변환이나 작업 생성 없이 큐 삽입과 대기 통계만 갱신합니다.
+        """
+        # 작업자가 꺼내면서 감소시키므로 큐에 넣기 전에 먼저 증가
+        self._incr_stat('pending_uploads')
+        self._queue.put((self._queue_key(upload_task), next(self._seq), upload_task))
+        
+        # 중지된 동안 들어온 작업은 큐에 남겨 두었다가 start()에서 실행 요청
+        executor = self._executor
+        if executor is not None:
             try:
-                # 우선순위 큐에서 먼저 작업 가져오기
-                try:
-                    upload_task = self.priority_queue.get(timeout=1)
-                except Empty:
-                    # 일반 큐에서 작업 가져오기
-                    try:
-                        upload_task = self.upload_queue.get(timeout=1)
-                    except Empty:
-                        continue
-                
-                # 업로드 수행
-                self._process_upload(upload_task)
-                
-                # 작업 완료 표시
-                self.upload_queue.task_done()
-                self.priority_queue.task_done()
-                
-            except Exception as e:
-                self.logger.error(f"업로드 작업자 오류: {str(e)}")
-                self.logger.exception("상세 에러 정보:")
+                executor.submit(self._run_next_task)
+            except RuntimeError:
+                pass
     
     def add_upload_task(self, file_path: Union[str, Path], 
                         file_info_id: int,
@@ -195,31 +338,81 @@ class UploadService:
                 priority=priority
             )
             
-            # 우선순위에 따라 큐 선택
-            if priority > 0:
-                self.priority_queue.put(upload_task)
-                self.logger.info(f"우선순위 업로드 작업 추가: {file_path} (우선순위: {priority})")
-            else:
-                self.upload_queue.put(upload_task)
-                self.logger.info(f"업로드 작업 추가: {file_path}")
-            
             # 통계 업데이트
-            with self.upload_lock:
-                self.stats['total_uploads'] += 1
-                self.stats['pending_uploads'] += 1
+            self._incr_stat('total_uploads')
+            
+            self._enqueue(upload_task)
+            if self.logger.isEnabledFor(logging.INFO):
+                if priority > 0:
+                    self.logger.info(f"우선순위 업로드 작업 추가: {file_path} (우선순위: {priority})")
+                else:
+                    self.logger.info(f"업로드 작업 추가: {file_path}")
             
-            return str(file_path)
+            return upload_task.key
             
         except Exception as e:
-            self.logger.error(f"업로드 작업 추가 실패: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"업로드 작업 추가 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
+            raise
+    
+    def add_upload_tasks(self, items: List[tuple]) -> List[str]:
+        """
+        여러 업로드 작업을 한 번에 큐에 추가합니다.
+        
+        Args:
+            items: (file_path, file_info_id, upload_result_id, priority) 튜플 목록
+        
+        Returns:
+            추가된 작업의 키 목록
+        """
+        try:
+            upload_tasks = [
+                UploadTask(
+                    file_path=Path(file_path),
+                    file_info_id=file_info_id,
+                    upload_result_id=upload_result_id,
+                    status=UploadStatus.PENDING,
+                    priority=priority
+                )
+                for file_path, file_info_id, upload_result_id, priority in items
+            ]
+            count = len(upload_tasks)
+            if not count:
+                return []
+            
+            # 통계 업데이트 (작업마다가 아니라 묶음당 한 번)
+            self._incr_stat('total_uploads', count)
+            self._incr_stat('pending_uploads', count)
+            
+            # 큐에 모두 삽입
+            put = self._queue.put
+            for upload_task in upload_tasks:
+                put((self._queue_key(upload_task), next(self._seq), upload_task))
+            
+            # 작업 수만큼 작업자 풀에 실행 요청 (중지 중이면 start()에서 요청)
+            executor = self._executor
+            if executor is not None:
+                try:
+                    for _ in range(count):
+                        executor.submit(self._run_next_task)
+                except RuntimeError:
+                    pass
+            
+            self.logger.info(f"업로드 작업 일괄 추가: {count}개")
+            
+            return [upload_task.key for upload_task in upload_tasks]
+            
+        except Exception as e:
+            self.logger.error(f"업로드 작업 일괄 추가 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
             raise
     
     def _process_upload(self, upload_task: UploadTask):
         """업로드 작업을 처리합니다."""
+        # finally에서 사용할 값은 try 밖에서 먼저 준비 (초기 오류 시에도 정리 가능하도록)
+        key = upload_task.key
+        file_path = upload_task.file_path
+        attempt = upload_task.retry_count
+        
         try:
-            file_path = upload_task.file_path
-            
             self.logger.info(f"업로드 시작: {file_path}")
             
             # 상태를 업로드 중으로 업데이트
@@ -227,15 +420,18 @@ class UploadService:
             
             # 활성 업로드에 추가
             with self.upload_lock:
-                self.active_uploads[str(file_path)] = upload_task
-                self.stats['pending_uploads'] -= 1
+                self.active_uploads[key] = upload_task
+            self._incr_stat('pending_uploads', -1)
             
             # 시작 콜백 호출
             if self.on_upload_started_callback:
-                self.on_upload_started_callback(upload_task)
+                self._dispatch_callback(self.on_upload_started_callback, upload_task)
             
-            # API 클라이언트로 파일 업로드
-            upload_result = self.api_client.upload_file(file_path)
+            # API 클라이언트로 파일 업로드 (프로세스 풀 사용 시 작업자 프로세스에서 수행)
+            if self._process_pool:
+                upload_result = self._process_pool.submit(_upload_in_process, key).result()
+            else:
+                upload_result = self.api_client.upload_file(file_path)
             
             if upload_result['success']:
                 # 업로드 성공
@@ -246,21 +442,22 @@ class UploadService:
             
         except Exception as e:
             error_msg = f"업로드 처리 중 오류 발생: {str(e)}"
-            self.logger.error(error_msg)
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             
             upload_task.update_status(UploadStatus.FAILED, error_message=error_msg)
             self._handle_upload_failure(upload_task, {'error': error_msg})
         
         finally:
-            # 활성 업로드에서 제거
-            with self.upload_lock:
-                self.active_uploads.pop(str(file_path), None)
+            # 활성 업로드에서 제거 (재시도가 예약된 경우 재시도 처리에서 이미 제거했으므로 건너뜀)
+            if upload_task.retry_count == attempt:
+                with self.upload_lock:
+                    if self.active_uploads.get(key) is upload_task:
+                        del self.active_uploads[key]
     
     def _handle_upload_success(self, upload_task: UploadTask, upload_result: Dict):
         """업로드 성공을 처리합니다."""
         try:
-            file_path = upload_task.file_path
+            file_path = upload_task.key
             
             self.logger.info(f"업로드 성공: {file_path}")
             
@@ -274,21 +471,19 @@ class UploadService:
             self._update_upload_result(upload_task, upload_result)
             
             # 통계 업데이트
-            with self.upload_lock:
-                self.stats['successful_uploads'] += 1
+            self._incr_stat('successful_uploads')
             
             # 성공 콜백 호출
             if self.on_upload_completed_callback:
-                self.on_upload_completed_callback(upload_task, upload_result['data'])
+                self._dispatch_callback(self.on_upload_completed_callback, upload_task, upload_result['data'])
             
         except Exception as e:
-            self.logger.error(f"업로드 성공 처리 중 오류: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"업로드 성공 처리 중 오류: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
     
     def _handle_upload_failure(self, upload_task: UploadTask, upload_result: Dict):
         """업로드 실패를 처리합니다."""
         try:
-            file_path = upload_task.file_path
+            file_path = upload_task.key
             error_msg = upload_result.get('error', '알 수 없는 오류')
             
             self.logger.error(f"업로드 실패: {file_path} - {error_msg}")
@@ -304,32 +499,19 @@ class UploadService:
                 self._update_upload_result(upload_task, upload_result)
                 
                 # 통계 업데이트
-                with self.upload_lock:
-                    self.stats['failed_uploads'] += 1
-                
-                                # 실패 콜백 호출
-                if self.on_upload_failed_callback:
-                    self.on_upload_failed_callback(upload_task, error_msg)
-                
-                # 데이터베이스 업데이트
-                self._update_upload_result(upload_task, upload_result)
-                
-                # 통계 업데이트
-                with self.upload_lock:
-                    self.stats['failed_uploads'] += 1
+                self._incr_stat('failed_uploads')
                 
                 # 실패 콜백 호출
                 if self.on_upload_failed_callback:
-                    self.on_upload_failed_callback(upload_task, error_msg)
+                    self._dispatch_callback(self.on_upload_failed_callback, upload_task, error_msg)
             
         except Exception as e:
-            self.logger.error(f"업로드 실패 처리 중 오류: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"업로드 실패 처리 중 오류: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
     
     def _handle_upload_retry(self, upload_task: UploadTask, error_msg: str):
         """업로드 재시도를 처리합니다."""
         try:
-            file_path = upload_task.file_path
+            file_path = upload_task.key
             
             # 재시도 횟수 증가
             upload_task.increment_retry()
@@ -340,73 +522,147 @@ class UploadService:
             upload_task.update_status(UploadStatus.RETRY, error_message=error_msg)
             
             # 통계 업데이트
-            with self.upload_lock:
-                self.stats['retry_uploads'] += 1
+            self._incr_stat('retry_uploads')
             
             # 재시도 콜백 호출
             if self.on_upload_retry_callback:
-                self.on_upload_retry_callback(upload_task, error_msg)
+                self._dispatch_callback(self.on_upload_retry_callback, upload_task, error_msg)
             
-            # 재시도 지연 후 큐에 다시 추가
-            time.sleep(self.retry_delay)
-            
-            if upload_task.priority > 0:
-                self.priority_queue.put(upload_task)
-            else:
-                self.upload_queue.put(upload_task)
+            # 다시 큐에 넣기 전에 활성 업로드에서 제거 (재실행 시 새로 등록됨)
+            with self.upload_lock:
+                if self.active_uploads.get(upload_task.key) is upload_task:
+                    del self.active_uploads[upload_task.key]
+            
+            # 작업자를 붙잡지 않고 지연 후 큐에 다시 추가되도록 예약 (재시도마다 대기 시간 2배)
+            delay = self.retry_delay * 2 ** (upload_task.retry_count - 1)
+            with self._delay_cond:
+                if self.shutdown_event.is_set():
+                    # 중지 중에는 대기 없이 바로 큐에 추가 (남은 작업과 함께 처리)
+                    self._enqueue(upload_task)
+                else:
+                    heapq.heappush(self._delay_heap, (time.monotonic() + delay, next(self._seq), upload_task))
+                    self._delay_cond.notify()
             
-            self.logger.info(f"업로드 작업 재큐 추가: {file_path}")
+            self.logger.info(f"업로드 작업 재큐 예약: {file_path} ({delay}초 후)")
             
         except Exception as e:
-            self.logger.error(f"업로드 재시도 처리 중 오류: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"업로드 재시도 처리 중 오류: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
+    
+    def _start_delay_thread(self):
+        """재시도 대기 작업을 큐에 다시 넣는 스레드를 시작합니다."""
+        self._delay_thread = threading.Thread(
+            target=self._delay_loop,
+            name="UploadRetryScheduler",
+            daemon=True
+        )
+        self._delay_thread.start()
+    
+    def _delay_loop(self):
+        """재시도 시각이 된 작업을 업로드 큐에 넣고, 다음 재시도 시각까지 대기합니다."""
+        with self._delay_cond:
+            while not self.shutdown_event.is_set():
+                now = time.monotonic()
+                while self._delay_heap and self._delay_heap[0][0] <= now:
+                    _, _, upload_task = heapq.heappop(self._delay_heap)
+                    self._enqueue(upload_task)
+                
+                timeout = self._delay_heap[0][0] - now if self._delay_heap else None
+                self._delay_cond.wait(timeout)
     
     def _update_upload_result(self, upload_task: UploadTask, upload_result: Dict):
-        """업로드 결과를 데이터베이스에 업데이트합니다."""
+        """업로드 결과 갱신을 DB 기록 스레드에 넘깁니다. (작업자 스레드는 세션을 열지 않음)"""
+        self._db_write_queue.put((
+            upload_task.upload_result_id,
+            upload_task.status,
+            upload_task.api_response,
+            upload_task.error_message
+        ))
+    
+    def _start_db_writer(self):
+        """업로드 결과 DB 기록 스레드를 시작합니다."""
+        self._db_writer_thread = threading.Thread(
+            target=self._db_writer_loop,
+            name="UploadResultWriter",
+            daemon=True
+        )
+        self._db_writer_thread.start()
+    
+    def _db_writer_loop(self):
+        """쌓인 업로드 결과 갱신을 최대 배치 크기 또는 대기 시간 단위로 모아 한 세션에서 기록합니다."""
+        while True:
+            item = self._db_write_queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self._db_write_interval
+            
+            while len(batch) < self._db_write_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._db_write_queue.get(timeout=remaining)
+                except Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            self._write_upload_results(batch)
+            
+            if stop:
+                break
+    
+    def _write_upload_results(self, batch: List[tuple]):
+        """업로드 결과 갱신 묶음을 한 번의 조회와 한 번의 커밋으로 기록합니다."""
         try:
             session = self.db_manager.get_session()
             
             try:
-                # 업로드 결과 조회
-                upload_result_record = session.query(UploadResult).filter(
-                    UploadResult.id == upload_task.upload_result_id
-                ).first()
+                # 업로드 결과 일괄 조회
+                ids = {upload_result_id for upload_result_id, _, _, _ in batch}
+                records = {
+                    record.id: record
+                    for record in session.query(UploadResult).filter(UploadResult.id.in_(ids))
+                }
                 
-                if upload_result_record:
-                    if upload_task.status == UploadStatus.SUCCESS:
+                for upload_result_id, status, api_response, error_message in batch:
+                    upload_result_record = records.get(upload_result_id)
+                    if upload_result_record is None:
+                        self.logger.warning(f"업로드 결과를 찾을 수 없습니다: {upload_result_id}")
+                        continue
+                    
+                    if status == UploadStatus.SUCCESS:
                         # 성공 시 API 응답 업데이트
-                        upload_result_record.update_api_response(
-                            session,
-                            upload_task.api_response
-                        )
+                        upload_result_record.update_api_response(session, api_response, commit=False)
                     else:
                         # 실패 시 오류 정보 업데이트
-                        upload_result_record.mark_upload_failed(
-                            session,
-                            upload_task.error_message
-                        )
-                    
-                    self.logger.debug(f"업로드 결과 데이터베이스 업데이트 완료: {upload_task.upload_result_id}")
-                else:
-                    self.logger.warning(f"업로드 결과를 찾을 수 없습니다: {upload_task.upload_result_id}")
+                        upload_result_record.mark_upload_failed(session, error_message, commit=False)
+                
+                session.commit()
+                self.logger.debug(f"업로드 결과 데이터베이스 업데이트 완료: {len(batch)}건")
                 
             finally:
                 session.close()
                 
         except Exception as e:
-            self.logger.error(f"업로드 결과 데이터베이스 업데이트 실패: {str(e)}")
-            self.logger.exception("상세 에러 정보:")
+            self.logger.error(f"업로드 결과 데이터베이스 업데이트 실패: {str(e)}", exc_info=self.logger.isEnabledFor(logging.DEBUG))
     
     def get_upload_status(self, file_path: str) -> Optional[Dict]:
         """특정 파일의 업로드 상태를 반환합니다."""
-        # 활성 업로드에서 찾기
-        if file_path in self.active_uploads:
-            task = self.active_uploads[file_path]
+        # 활성 업로드에서 찾기 (락 안에서는 참조만 가져오고 변환은 락 밖에서 수행)
+        with self.upload_lock:
+            task = self.active_uploads.get(file_path)
+        
+        if task is not None:
             return {
                 'status': task.status.value,
                 'priority': task.priority,
-                'created_at': task.created_at.isoformat(),
-                'started_at': task.started_at.isoformat() if task.started_at else None,
+                'created_at': task._created_at_iso,
+                'started_at': task._started_at_iso,
                 'retry_count': task.retry_count,
                 'error_message': task.error_message
             }
@@ -416,8 +672,7 @@ class UploadService:
     def get_queue_status(self) -> Dict:
         """업로드 큐 상태 정보를 반환합니다."""
         return {
-            'upload_queue_size': self.upload_queue.qsize(),
-            'priority_queue_size': self.priority_queue.qsize(),
+            'upload_queue_size': self._queue.qsize(),
             'active_uploads_count': len(self.active_uploads),
             'is_running': self.is_running,
             'stats': self.stats.copy()
@@ -425,21 +680,22 @@ class UploadService:
     
     def get_active_uploads(self) -> List[Dict]:
         """현재 활성 업로드 목록을 반환합니다."""
-        active_uploads = []
-        
+        # 락 안에서는 목록 스냅샷만 만들고 딕셔너리 변환은 락 밖에서 수행
         with self.upload_lock:
-            for file_path, task in self.active_uploads.items():
-                active_uploads.append({
-                    'file_path': file_path,
-                    'status': task.status.value,
-                    'priority': task.priority,
-                    'created_at': task.created_at.isoformat(),
-                    'started_at': task.started_at.isoformat() if task.started_at else None,
-                    'retry_count': task.retry_count,
-                    'error_message': task.error_message
-                })
-        
-        return active_uploads
+            tasks = list(self.active_uploads.items())
+        
+        return [
+            {
+                'file_path': file_path,
+                'status': task.status.value,
+                'priority': task.priority,
+                'created_at': task._created_at_iso,
+                'started_at': task._started_at_iso,
+                'retry_count': task.retry_count,
+                'error_message': task.error_message
+            }
+            for file_path, task in tasks
+        ]
     
     def cancel_upload(self, file_path: str) -> bool:
         """업로드를 취소합니다."""
@@ -487,6 +743,23 @@ class UploadService:
         
         self.is_running = True
         self.shutdown_event.clear()
+        
+        # 중지 후 재시작한 경우 작업자 풀과 DB 기록 / 재시도 예약 스레드 재시작
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_uploads,
+                thread_name_prefix='UploadWorker'
+            )
+            
+            # 중지된 동안 큐에 남은 작업 실행 요청
+            for _ in range(self._queue.qsize()):
+                self._executor.submit(self._run_next_task)
+        
+        if self._db_writer_thread is None or not self._db_writer_thread.is_alive():
+            self._start_db_writer()
+        if self._delay_thread is None or not self._delay_thread.is_alive():
+            self._start_delay_thread()
+        
         self.logger.info("업로드 서비스 시작")
     
     def stop(self):
@@ -499,9 +772,33 @@ class UploadService:
         self.shutdown_event.set()
         self.is_running = False
         
-        # 모든 큐 작업 완료 대기
-        self.upload_queue.join()
-        self.priority_queue.join()
+        # 재시도 대기 중인 작업은 바로 큐에 넣고 예약 스레드 종료
+        with self._delay_cond:
+            while self._delay_heap:
+                _, _, upload_task = heapq.heappop(self._delay_heap)
+                self._enqueue(upload_task)
+            self._delay_cond.notify()
+        
+        # 예약 스레드가 끝난 것을 확인 (남아 있으면 재시작 시 새 스레드를 만들지 않아 재시도가 멈춤)
+        if self._delay_thread:
+            self._delay_thread.join()
+            self._delay_thread = None
+        
+        # 모든 큐 작업 완료 대기 후 작업자 풀 종료
+        # (큐에 든 작업마다 실행 요청이 제출되어 있고, 대기 중 발생한 재시도도 중지 중에는 바로 큐에 들어가므로 join이 끝남)
+        self._queue.join()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        # 남은 결과를 기록한 뒤 DB 기록 스레드 종료
+        self._db_write_queue.put(None)
+        if self._db_writer_thread:
+            self._db_writer_thread.join(timeout=10)
+            if self._db_writer_thread.is_alive():
+                self.logger.warning("업로드 결과 DB 기록 스레드가 제한 시간 내에 종료되지 않았습니다.")
+            else:
+                self._db_writer_thread = None
         
         self.logger.info("업로드 서비스 중지 완료")
     
@@ -511,13 +808,24 @@ class UploadService:
             # API 클라이언트 정리
             self.api_client.close()
             
+            # 업로드 프로세스 풀 정리
+            if self._process_pool:
+                self._process_pool.shutdown(wait=True)
+                self._process_pool = None
+            if self._process_log_listener:
+                self._process_log_listener.stop()
+                self._process_log_listener = None
+            
+            # 남은 콜백 실행 후 콜백 스레드 종료
+            self._callback_executor.shutdown(wait=True)
+            
             self.logger.info("업로드 서비스 리소스 정리 완료")
             
         except Exception as e:
             self.logger.error(f"업로드 서비스 리소스 정리 실패: {str(e)}")
 
 
-# 테스트 코드
+# 테스트 코드 (프로젝트 루트에서 python -m src.services.upload_service 로 실행)
 if __name__ == "__main__":
     print("UploadService 테스트:")
     
@@ -5,9 +5,15 @@
 
 import os
 import time
+import random
+import functools
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
+from sqlalchemy import update
+from sqlalchemy.orm import Session
 
 # 프로젝트 루트를 Python 경로에 추가
 import sys
@@ -21,33 +27,87 @@ from src.services.api_client import APIClient
 from src.db.connection import DatabaseManager
 
 
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """업로드 재시도 설정 (설정 파일에서 한 번만 읽어 모든 서비스 인스턴스가 공유)"""
+    max_retries: int
+    base_delay: float
+    max_delay: float
+    jitter: float
+
+
+@functools.lru_cache(maxsize=1)
+def get_retry_policy() -> RetryPolicy:
+    """설정의 api 섹션에서 재시도 정책을 만듭니다. (첫 호출 시 한 번만 설정 로드)"""
+    from config.settings import get_config
+    config = get_config()
+    api_config = config.get('api', {})
+    return RetryPolicy(
+        max_retries=api_config.get('retry_attempts', 3),
+        # 재시도 대기: 지수 백오프 + 지터 (이전 retry_delay_seconds 설정은 기본 대기 시간으로 사용)
+        base_delay=api_config.get('retry_base_delay_seconds', api_config.get('retry_delay_seconds', 1.0)),
+        max_delay=api_config.get('retry_max_delay_seconds', 30),
+        jitter=api_config.get('retry_jitter', 0.5)
+    )
+
+
 class UploaderService:
     """파일 업로드 및 응답 처리 서비스"""
     
-    def __init__(self):
+    def __init__(self, pool_size: Optional[int] = None):
         self.logger = get_logger(__name__)
-        self.api_client = APIClient()
         self.db_manager = DatabaseManager()
         
-        # 재시도 설정 로드
-        from config.settings import get_config
-        config = get_config()
-        api_config = config.get('api', {})
-        self.max_retries = api_config.get('retry_attempts', 3)
-        self.retry_delay = api_config.get('retry_delay_seconds', 5)
+        # 재시도 설정 (프로세스당 한 번만 로드한 정책 사용)
+        policy = get_retry_policy()
+        self.max_retries = policy.max_retries
+        self.retry_base_delay = policy.base_delay
+        self.retry_max_delay = policy.max_delay
+        self.retry_jitter = policy.jitter
+        
+        # API 클라이언트 (이 서비스를 함께 호출하는 작업자들이 한 세션의 연결 풀을 공유하므로 pool_size만큼 연결 유지,
+        # None이면 API 클라이언트 기본값)
+        # 재시도는 이 서비스의 백오프 루프에서만 수행하므로 클라이언트 내부 재시도는 끔
+        self.api_client = APIClient(pool_size=pool_size, max_retries=0)
         
-        self.logger.info(f"UploaderService 초기화 완료 - 최대 재시도: {self.max_retries}, 재시도 지연: {self.retry_delay}초")
+        self.logger.info(f"UploaderService 초기화 완료 - 최대 재시도: {self.max_retries}, 재시도 지연: {self.retry_base_delay}~{self.retry_max_delay}초")
     
-    def upload_and_record(self, file_obj: FileInfo) -> bool:
+    def _compute_backoff(self, attempt: int) -> float:
+        """attempt번째 시도 실패 후 대기할 시간을 계산합니다. (지수 증가, 최대값 제한, 작업자끼리 겹치지 않도록 지터 적용)"""
+        delay = min(self.retry_base_delay * 2 ** (attempt - 1), self.retry_max_delay)
+        return delay * (1 + random.uniform(0, self.retry_jitter))
+    
+    @staticmethod
+    def _is_retryable(upload_result: Dict) -> bool:
+        """재시도로 해결될 수 있는 실패인지 확인합니다. (408/429를 제외한 4xx는 다시 보내도 같은 결과)"""
+        http_status = upload_result.get('http_status')
+        if http_status is None:
+            return True
+        return not (400 <= http_status < 500) or http_status in (408, 429)
+    
+    def upload_and_record(self, file_obj: FileInfo, session: Optional[Session] = None) -> bool:
         """
         파일을 업로드하고 결과를 DB에 기록합니다.
         
         Args:
             file_obj: 업로드할 FileInfo 객체
+            session: 결과 기록에 사용할 세션 (None이면 새 세션 사용)
             
         Returns:
             bool: 업로드 성공 여부
         """
+        return self._record_outcome(file_obj, self._upload_with_retries(file_obj), session)
+    
+    def _upload_with_retries(self, file_obj: FileInfo) -> Tuple[str, object, Optional[int]]:
+        """
+        파일을 업로드하고(필요 시 재시도) 기록할 결과를 반환합니다. DB에는 접근하지 않습니다.
+        
+        Returns:
+            (결과 종류, 결과 데이터, 시도 횟수) 튜플
+            - ('success', upload_result, attempt): 업로드 성공
+            - ('failure', upload_result, attempt): API 응답 기준 최종 실패
+            - ('error', error_msg, None): 파일 없음 또는 예외로 인한 최종 실패
+        """
         try:
             self.logger.info(f"파일 업로드 시도: {file_obj.file_path}")
             
@@ -55,11 +115,11 @@ class UploaderService:
             if not os.path.exists(file_obj.file_path):
                 error_msg = f"파일이 존재하지 않습니다: {file_obj.file_path}"
                 self.logger.error(error_msg)
-                self._record_upload_failure(file_obj, error_msg)
-                return False
+                return 'error', error_msg, None
             
             # 재시도 루프
             attempt = 0
+            error_msg = '알 수 없는 오류로 업로드 실패'
             while attempt < self.max_retries:
                 attempt += 1
                 self.logger.info(f"파일 업로드 시도 ({attempt}/{self.max_retries}): {file_obj.file_path}")
@@ -70,183 +130,191 @@ class UploaderService:
                     
                     # 업로드 결과 처리
                     if upload_result['success']:
-                        return self._handle_upload_success(file_obj, upload_result, attempt)
+                        return 'success', upload_result, attempt
                     else:
                         # 실패 시 재시도 여부 결정
-                        if attempt < self.max_retries:
+                        if not self._is_retryable(upload_result):
+                            self.logger.error(f"재시도할 수 없는 업로드 실패 (HTTP {upload_result.get('http_status')}): {file_obj.file_name}")
+                            return 'failure', upload_result, attempt
+                        elif attempt < self.max_retries:
+                            delay = self._compute_backoff(attempt)
                             self.logger.warning(f"파일 업로드 실패 ({attempt}/{self.max_retries}): {file_obj.file_name}, 응답: {upload_result.get('error', '알 수 없는 오류')}")
-                            self.logger.info(f"재시도 대기 중 ({self.retry_delay}초): {file_obj.file_name}")
-                            time.sleep(self.retry_delay)
+                            self.logger.info(f"재시도 대기 중 ({delay:.1f}초): {file_obj.file_name}")
+                            time.sleep(delay)
                             continue
                         else:
                             self.logger.error(f"최대 재시도 횟수 초과, 파일 업로드 최종 실패: {file_obj.file_name}")
-                            return self._handle_upload_failure(file_obj, upload_result, attempt)
+                            return 'failure', upload_result, attempt
                 except Exception as e:
                     error_msg = f"API 업로드 중 예외 발생: {str(e)}"
                     self.logger.error(f"업로드 시도 {attempt} 실패: {error_msg}")
                     
                     if attempt < self.max_retries:
-                        self.logger.info(f"재시도 대기 중 ({self.retry_delay}초): {file_obj.file_name}")
-                        time.sleep(self.retry_delay)
+                        delay = self._compute_backoff(attempt)
+                        self.logger.info(f"재시도 대기 중 ({delay:.1f}초): {file_obj.file_name}")
+                        time.sleep(delay)
                         continue
                     else:
                         self.logger.error(f"최대 재시도 횟수 초과, 파일 업로드 최종 실패: {file_obj.file_name}")
-                        return self._record_upload_failure(file_obj, error_msg)
             
-            return False
+            return 'error', error_msg, None
                 
         except Exception as e:
             error_msg = f"파일 업로드 중 예상치 못한 오류 발생: {str(e)}"
             self.logger.error(error_msg)
             self.logger.exception("상세 에러 정보:")
-            self._record_upload_failure(file_obj, error_msg)
-            return False
+            return 'error', error_msg, None
+    
+    def _record_outcome(self, file_obj: FileInfo, outcome: Tuple[str, object, Optional[int]],
+                        session: Optional[Session] = None) -> bool:
+        """_upload_with_retries 결과를 DB에 기록하고 업로드 성공 여부를 반환합니다."""
+        kind, payload, attempt = outcome
+        if kind == 'success':
+            return self._handle_upload_success(file_obj, payload, attempt, session)
+        if kind == 'failure':
+            return self._handle_upload_failure(file_obj, payload, attempt, session)
+        self._record_upload_failure(file_obj, payload, session)
+        return False
+    
+    @contextmanager
+    def _session_scope(self, session: Optional[Session] = None):
+        """호출자의 세션이 있으면 그대로 쓰고(오류 시 롤백만 수행), 없으면 새 세션을 열고 닫습니다."""
+        if session is not None:
+            try:
+                yield session
+            except Exception:
+                session.rollback()
+                raise
+            return
+        
+        with self.db_manager.get_session() as new_session:
+            yield new_session
+    
+    def _persist_result(self, file_obj: FileInfo, processing_status: str,
+                        api_data: Optional[Dict] = None,
+                        error_msg: Optional[str] = None,
+                        error_details: Optional[Dict] = None,
+                        attempt: Optional[int] = None,
+                        session: Optional[Session] = None):
+        """
+        업로드 결과를 한 세션, 한 번의 커밋으로 기록합니다.
+        
+        FileInfo는 행을 불러오지 않고 기본 키 조건의 UPDATE 문으로 바로 갱신하고, UploadResult는 메모리에서
+        만든 뒤 함께 커밋하므로 INSERT 한 번과 UPDATE 한 번만 실행됩니다.
+        
+        Args:
+            file_obj: 업로드한 FileInfo 객체
+            processing_status: FileInfo에 기록할 처리 상태
+            api_data: 성공 시 API 응답 데이터 (None이면 실패로 기록)
+            error_msg: 실패 시 에러 메시지
+            error_details: 실패 시 상세 에러 정보
+            attempt: 업로드 시도 횟수 (None이면 한 번으로 기록)
+            session: 사용할 세션 (None이면 새 세션 사용)
+        """
+        with self._session_scope(session) as session:
+            # FileInfo 상태 업데이트 (ORM 객체를 불러오지 않고 UPDATE 한 번, 행이 없으면 아무것도 갱신하지 않음)
+            values = {'processing_status': processing_status, 'updated_at': datetime.utcnow()}
+            if error_msg is not None:
+                values['error_message'] = error_msg
+            session.execute(update(FileInfo).where(FileInfo.id == file_obj.id).values(**values))
+            
+            # UploadResult 생성 (커밋 전까지 SQL 실행 없음, 파일 크기는 FileInfo 값 재사용)
+            upload_record = UploadResult.create_from_file_info(
+                session=session,
+                file_path=file_obj.file_path,
+                folder_name=file_obj.folder_name,
+                file_size=file_obj.file_size,
+                commit=False
+            )
+            
+            if api_data is not None:
+                upload_record.update_api_response(session, api_data, commit=False)
+            else:
+                upload_record.mark_upload_failed(session, error_msg, error_details, commit=False)
+            
+            # 재시도 정보 반영
+            if attempt is not None:
+                upload_record.upload_attempts = attempt
+            
+            session.commit()
     
-    def _handle_upload_success(self, file_obj: FileInfo, upload_result: Dict, attempt: int = 1) -> bool:
+    def _handle_upload_success(self, file_obj: FileInfo, upload_result: Dict, attempt: int = 1,
+                               session: Optional[Session] = None) -> bool:
         """업로드 성공 처리"""
         try:
             self.logger.info(f"파일 업로드 성공: {file_obj.file_name}")
             
-            # API 응답 데이터 추출
-            api_data = upload_result.get('data', {})
+            self._persist_result(
+                file_obj,
+                'uploaded',
+                api_data=upload_result.get('data', {}),
+                attempt=attempt,
+                session=session
+            )
+            
+            self.logger.info(f"업로드 결과 DB 저장 완료: {file_obj.file_name}")
+            return True
             
-            # UploadResult 생성 및 저장
-            with self.db_manager.get_session() as session:
-                # FileInfo를 새 세션에서 조회하여 업데이트
-                file_info = session.query(FileInfo).filter(
-                    FileInfo.id == file_obj.id
-                ).first()
-                
-                if file_info:
-                    # FileInfo 상태 업데이트
-                    file_info.processing_status = 'uploaded'
-                    file_info.updated_at = datetime.utcnow()
-                    session.add(file_info)
-                
-                # UploadResult 생성
-                upload_record = UploadResult.create_from_file_info(
-                    session=session,
-                    file_path=file_obj.file_path,
-                    folder_name=file_obj.folder_name
-                )
-                
-                # API 응답 정보로 업데이트
-                upload_record.update_api_response(session, api_data)
-                
-                # 재시도 정보 추가
-                upload_record.upload_attempts = attempt
-                upload_record.last_upload_attempt = datetime.utcnow()
-                
-                # 세션 커밋
-                session.commit()
-                
-                self.logger.info(f"업로드 결과 DB 저장 완료: {file_obj.file_name}")
-                return True
-                
         except Exception as e:
             error_msg = f"업로드 성공 처리 중 오류: {str(e)}"
             self.logger.error(error_msg)
             self.logger.exception("상세 에러 정보:")
             return False
     
-    def _handle_upload_failure(self, file_obj: FileInfo, upload_result: Dict, attempt: int = 1) -> bool:
+    def _handle_upload_failure(self, file_obj: FileInfo, upload_result: Dict, attempt: int = 1,
+                               session: Optional[Session] = None) -> bool:
         """업로드 실패 처리"""
         try:
             error_msg = upload_result.get('error', '알 수 없는 오류')
             self.logger.error(f"파일 업로드 실패: {file_obj.file_name} - {error_msg}")
             
-            # UploadResult 생성 및 실패 상태 저장
-            with self.db_manager.get_session() as session:
-                # FileInfo를 새 세션에서 조회하여 업데이트
-                file_info = session.query(FileInfo).filter(
-                    FileInfo.id == file_obj.id
-                ).first()
-                
-                if file_info:
-                    # FileInfo 상태 업데이트
-                    file_info.processing_status = 'error'
-                    file_info.error_message = error_msg
-                    file_info.updated_at = datetime.utcnow()
-                    session.add(file_info)
-                
-                # UploadResult 생성
-                upload_record = UploadResult.create_from_file_info(
-                    session=session,
-                    file_path=file_obj.file_path,
-                    folder_name=file_obj.folder_name
-                )
-                
-                # 실패 상태로 표시
-                # upload_result에서 datetime 객체를 문자열로 변환
-                serializable_result = {}
-                for key, value in upload_result.items():
-                    if isinstance(value, datetime):
-                        serializable_result[key] = value.isoformat()
-                    else:
-                        serializable_result[key] = value
-                
-                upload_record.mark_upload_failed(
-                    session=session,
-                    error_message=error_msg,
-                    error_details={
-                        'api_response': serializable_result,
-                        'status_code': upload_result.get('status_code'),
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'attempt_number': attempt
-                    }
-                )
-                
-                # 세션 커밋
-                session.commit()
-                
-                self.logger.info(f"업로드 실패 결과 DB 저장 완료: {file_obj.file_name}")
-                return False
-                
+            # upload_result에서 datetime 객체를 문자열로 변환
+            serializable_result = {}
+            for key, value in upload_result.items():
+                if isinstance(value, datetime):
+                    serializable_result[key] = value.isoformat()
+                else:
+                    serializable_result[key] = value
+            
+            self._persist_result(
+                file_obj,
+                'error',
+                error_msg=error_msg,
+                error_details={
+                    'api_response': serializable_result,
+                    'status_code': upload_result.get('http_status'),
+                    'timestamp': datetime.utcnow().isoformat(),
+                    'attempt_number': attempt
+                },
+                attempt=attempt,
+                session=session
+            )
+            
+            self.logger.info(f"업로드 실패 결과 DB 저장 완료: {file_obj.file_name}")
+            return False
+            
         except Exception as e:
             error_msg = f"업로드 실패 처리 중 오류: {str(e)}"
             self.logger.error(error_msg)
             self.logger.exception("상세 에러 정보:")
             return False
     
-    def _record_upload_failure(self, file_obj: FileInfo, error_msg: str):
+    def _record_upload_failure(self, file_obj: FileInfo, error_msg: str, session: Optional[Session] = None):
         """업로드 실패를 DB에 기록합니다."""
         try:
-            # UploadResult 생성 및 실패 상태 저장
-            with self.db_manager.get_session() as session:
-                # FileInfo를 새 세션에서 조회하여 업데이트
-                file_info = session.query(FileInfo).filter(
-                    FileInfo.id == file_obj.id
-                ).first()
-                
-                if file_info:
-                    # FileInfo 상태 업데이트
-                    file_info.processing_status = 'error'
-                    file_info.error_message = error_msg
-                    file_info.updated_at = datetime.utcnow()
-                    session.add(file_info)
-                
-                # UploadResult 생성
-                upload_record = UploadResult.create_from_file_info(
-                    session=session,
-                    file_path=file_obj.file_path,
-                    folder_name=file_obj.folder_name
-                )
-                
-                # 실패 상태로 표시
-                upload_record.mark_upload_failed(
-                    session=session,
-                    error_message=error_msg,
-                    error_details={
-                        'error_type': 'file_not_found',
-                        'timestamp': datetime.utcnow().isoformat()
-                    }
-                )
-                
-                # 세션 커밋
-                session.commit()
-                
-                self.logger.info(f"업로드 실패 기록 완료: {file_obj.file_name}")
-                
+            self._persist_result(
+                file_obj,
+                'error',
+                error_msg=error_msg,
+                error_details={
+                    'error_type': 'file_not_found',
+                    'timestamp': datetime.utcnow().isoformat()
+                },
+                session=session
+            )
+            
+            self.logger.info(f"업로드 실패 기록 완료: {file_obj.file_name}")
+            
         except Exception as e:
             self.logger.error(f"업로드 실패 기록 중 오류: {str(e)}")
     
@@ -259,6 +327,35 @@ class UploaderService:
             self.logger.error(f"업로드 대기 파일 조회 중 오류: {str(e)}")
             return []
     
+    def iter_pending_uploads(self, chunk_size: int = 100) -> Iterator[UploadResult]:
+        """업로드 대기 중인 파일들을 chunk_size개씩 나눠 조회하며 반환합니다."""
+        return self._iter_uploads('pending', chunk_size)
+    
+    def iter_failed_uploads(self, chunk_size: int = 100) -> Iterator[UploadResult]:
+        """업로드 실패한 파일들을 chunk_size개씩 나눠 조회하며 반환합니다."""
+        return self._iter_uploads('failed', chunk_size)
+    
+    def _iter_uploads(self, upload_status: str, chunk_size: int) -> Iterator[UploadResult]:
+        """
+        키셋 페이지네이션으로 업로드 결과를 조회합니다.
+        
+        청크마다 세션을 새로 열고 닫으므로 메모리에는 청크 하나만 유지되고,
+        호출자는 첫 청크를 받는 즉시 처리를 시작할 수 있습니다.
+        """
+        after_id = 0
+        while True:
+            try:
+                with self.db_manager.get_session() as session:
+                    chunk = UploadResult.get_uploads_after(session, upload_status, after_id, chunk_size)
+            except Exception as e:
+                self.logger.error(f"업로드 결과 조회 중 오류 ({upload_status}): {str(e)}")
+                return
+            
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            after_id = chunk[-1].id
+    
     def get_failed_uploads(self, limit: Optional[int] = None) -> list:
         """업로드 실패한 파일들을 조회합니다."""
         try:
@@ -286,8 +383,8 @@ class UploaderService:
                 # 재시도를 위해 상태 초기화
                 upload_result.reset_for_retry(session)
                 
-                # 업로드 재시도
-                return self.upload_and_record(file_info)
+                # 업로드 재시도 (결과 기록도 같은 세션 사용)
+                return self.upload_and_record(file_info, session)
                 
         except Exception as e:
             error_msg = f"업로드 재시도 중 오류: {str(e)}"
@@ -296,8 +393,18 @@ class UploaderService:
             return False
 
 
-# 전역 인스턴스
-uploader_service = UploaderService()
+# 전역 인스턴스 (import 시점이 아니라 처음 사용할 때 생성)
+@functools.lru_cache(maxsize=1)
+def get_uploader_service() -> UploaderService:
+    """전역 UploaderService 인스턴스를 반환합니다."""
+    return UploaderService()
+
+
+def __getattr__(name):
+    # 기존 `uploader_service` 모듈 속성 접근 호환
+    if name == 'uploader_service':
+        return get_uploader_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # 테스트 코드
@@ -0,0 +1,50 @@
+"""
+블룸 필터 모듈
+많은 수의 문자열 키에 대해 적은 메모리로 근사 멤버십 검사를 제공합니다.
+"""
+
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """문자열 키용 블룸 필터 (거짓 음성 없음, 거짓 양성은 error_rate 이하)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+
+        # 최적 비트 수와 해시 함수 수 계산
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        """키에 해당하는 비트 위치들을 반환합니다. (이중 해싱)"""
+        digest = hashlib.blake2b(key.encode('utf-8', 'surrogateescape'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """키를 추가합니다."""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """키가 존재할 수 있으면 True, 확실히 없으면 False를 반환합니다."""
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def is_saturated(self) -> bool:
+        """추가된 키가 용량을 넘어 거짓 양성 비율이 보장되지 않는지 여부"""
+        return self.count > self.capacity
@@ -0,0 +1,131 @@
+"""
+배치 입출력 큐 모듈
+여러 생산자/소비자 스레드가 공유하는 큐로, 한 번의 락 획득으로 여러 작업을 넣고 꺼낼 수 있습니다.
+"""
+
+import threading
+import time
+from collections import deque
+from queue import Empty, Full
+from typing import Any, Iterable, List, Optional
+
+
+class BoundedMPMCQueue:
+    """deque와 단일 락 기반의 MPMC 큐 (get_batch/put_many 지원)"""
+
+    def __init__(self, maxsize: int = 0):
+        # maxsize가 0 이하이면 크기 제한 없음
+        self.maxsize = maxsize
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_tasks_done = threading.Condition(self._lock)
+        self._unfinished_tasks = 0
+
+    def _wait_not_full(self, block: bool, timeout: Optional[float]):
+        """큐에 빈 자리가 생길 때까지 대기합니다. (락을 보유한 상태에서 호출)"""
+        if self.maxsize <= 0:
+            return
+
+        if not block:
+            if len(self._items) >= self.maxsize:
+                raise Full
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._items) >= self.maxsize:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise Full
+            self._not_full.wait(remaining)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        """작업 하나를 추가합니다."""
+        with self._lock:
+            self._wait_not_full(block, timeout)
+            self._items.append(item)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_many(self, items: Iterable[Any]):
+        """여러 작업을 한 번의 락 획득으로 추가하고 대기 중인 소비자를 추가된 수만큼 깨웁니다."""
+        items = list(items)
+        if not items:
+            return
+
+        with self._lock:
+            if self.maxsize > 0:
+                for item in items:
+                    self._wait_not_full(True, None)
+                    self._items.append(item)
+            else:
+                self._items.extend(items)
+            self._unfinished_tasks += len(items)
+            self._not_empty.notify(len(items))
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """작업 하나를 꺼냅니다. 작업이 없으면 queue.Empty를 발생시킵니다."""
+        items = self.get_batch(max_n=1, timeout=timeout if block else 0)
+        if not items:
+            raise Empty
+        return items[0]
+
+    def get_nowait(self) -> Any:
+        """대기 없이 작업 하나를 꺼냅니다."""
+        return self.get(block=False)
+
+    def get_batch(self, max_n: int = 16, timeout: Optional[float] = None, consumers: int = 1) -> List[Any]:
+        """
+        최대 max_n개의 작업을 한 번에 꺼냅니다.
+
+        작업이 하나도 없으면 timeout 동안 대기하고, 그래도 없으면 빈 리스트를 반환합니다.
+        consumers가 2 이상이면 대기 작업을 소비자 수로 나눈 몫까지만 가져가므로,
+        작업이 적을 때는 배치가 작아져 여러 소비자에게 고르게 분배되고
+        작업이 몰릴 때는 max_n까지 커집니다.
+        """
+        with self._lock:
+            if not self._items:
+                if timeout is not None and timeout <= 0:
+                    return []
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._items:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return []
+                    self._not_empty.wait(remaining)
+
+            waiting = len(self._items)
+            fair_share = -(-waiting // consumers) if consumers > 1 else waiting
+            count = max(1, min(max_n, fair_share))
+            batch = [self._items.popleft() for _ in range(count)]
+
+            if self.maxsize > 0:
+                self._not_full.notify(count)
+
+            return batch
+
+    def task_done(self, count: int = 1):
+        """꺼낸 작업의 처리 완료를 표시합니다."""
+        with self._lock:
+            unfinished = self._unfinished_tasks - count
+            if unfinished < 0:
+                raise ValueError("task_done() called too many times")
+            self._unfinished_tasks = unfinished
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        """모든 작업이 처리될 때까지 대기합니다."""
+        with self._lock:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def qsize(self) -> int:
+        """대기 중인 작업 수를 반환합니다."""
+        with self._lock:
+            return len(self._items)
+
+    def empty(self) -> bool:
+        """큐가 비어 있는지 확인합니다."""
+        return self.qsize() == 0
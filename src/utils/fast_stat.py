@@ -0,0 +1,123 @@
+"""
+경량 파일 상태 조회 모듈
+Linux에서는 statx(2)로 파일 종류와 크기만 요청하고, 그 외 환경에서는 os.stat으로 대체합니다.
+"""
+
+import os
+import sys
+import ctypes
+import platform
+from typing import Tuple, Union
+
+# statx 시스템 콜 번호 (아키텍처별)
+_SYS_STATX = {
+    'x86_64': 332,
+    'aarch64': 291,
+}
+
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_SIZE = 0x0200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ('tv_sec', ctypes.c_int64),
+        ('tv_nsec', ctypes.c_uint32),
+        ('__reserved', ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx (linux/stat.h, 256 bytes)"""
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32),
+        ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32),
+        ('stx_uid', ctypes.c_uint32),
+        ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16),
+        ('__spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64),
+        ('stx_size', ctypes.c_uint64),
+        ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp),
+        ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp),
+        ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32),
+        ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32),
+        ('stx_dev_minor', ctypes.c_uint32),
+        ('__spare2', ctypes.c_uint64 * 14),
+    ]
+
+
+def _call_statx(syscall, sys_no: int, path: bytes) -> Tuple[int, _Statx]:
+    buf = _Statx()
+    ret = syscall(
+        ctypes.c_long(sys_no),
+        ctypes.c_int(AT_FDCWD),
+        ctypes.c_char_p(path),
+        ctypes.c_int(AT_STATX_DONT_SYNC),
+        ctypes.c_uint(STATX_TYPE | STATX_SIZE),
+        ctypes.byref(buf)
+    )
+    return ret, buf
+
+
+def _probe_statx():
+    """statx 사용 가능 여부를 한 번만 확인합니다. 사용할 수 없으면 None을 반환합니다."""
+    if sys.platform != 'linux':
+        return None
+
+    sys_no = _SYS_STATX.get(platform.machine())
+    if sys_no is None:
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        syscall = libc.syscall
+        syscall.restype = ctypes.c_long
+
+        # 알려진 경로로 호출해 커널 지원 여부 확인 (ENOSYS 등 실패 시 os.stat 사용)
+        ret, _ = _call_statx(syscall, sys_no, b'/')
+        if ret != 0:
+            return None
+    except Exception:
+        return None
+
+    return syscall, sys_no
+
+
+_STATX = _probe_statx()
+
+
+def fast_stat(path: Union[str, os.PathLike]) -> Tuple[int, int]:
+    """
+    파일의 모드와 크기를 반환합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        (st_mode, st_size) 튜플
+
+    Raises:
+        OSError: 파일 상태를 조회할 수 없는 경우 (없는 파일은 FileNotFoundError)
+    """
+    if _STATX is None:
+        st = os.stat(path)
+        return st.st_mode, st.st_size
+
+    syscall, sys_no = _STATX
+    ret, buf = _call_statx(syscall, sys_no, os.fsencode(path))
+    if ret != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), os.fspath(path))
+
+    return buf.stx_mode, buf.stx_size
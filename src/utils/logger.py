@@ -10,11 +10,29 @@ import sys
 import gzip
 import shutil
 import json
+import queue
+import atexit
+import functools
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, Future
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+# zstandard가 설치되어 있으면 로그 압축에 사용 (없으면 gzip으로 대체)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# orjson이 설치되어 있으면 구조화 로그 직렬화에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
@@ -36,70 +54,181 @@ except ImportError:
         }
 
 
+class _LogFileEventHandler(FileSystemEventHandler):
+    """감시 중인 로그 파일의 변경(기록/생성/로테이션) 이벤트만 LogMonitor로 전달하는 핸들러"""
+    
+    def __init__(self, monitor: 'LogMonitor'):
+        self.monitor = monitor
+    
+    def on_modified(self, event):
+        if not event.is_directory and event.src_path == self.monitor.log_path:
+            self.monitor._schedule_check()
+    
+    def on_created(self, event):
+        if not event.is_directory and event.src_path == self.monitor.log_path:
+            self.monitor._schedule_check()
+    
+    def on_moved(self, event):
+        if not event.is_directory and self.monitor.log_path in (event.src_path, event.dest_path):
+            self.monitor._schedule_check()
+
+
 class LogMonitor:
     """로그 파일 모니터링 및 성능 최적화 클래스"""
     
-    def __init__(self, log_file: str, max_size_mb: int = 100):
+    def __init__(self, log_file: str, max_size_mb: int = 100, debounce_sec: float = 1.0):
         self.log_file = log_file
+        self.log_path = os.path.abspath(log_file)
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.monitoring = False
         self.monitor_thread = None
+        
+        # 주기적 확인 루프 중지 신호 (대기 중에도 즉시 깨어나 종료)
+        self._stop_event = threading.Event()
+        
+        # 파일 변경 이벤트 감시 (이벤트가 몰려도 debounce_sec 구간당 한 번만 확인)
+        self.observer = None
+        self.debounce_sec = debounce_sec
+        self._timer_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._size_warned = False
         self.stats = {
             'total_logs': 0,
             'error_count': 0,
             'warning_count': 0,
             'last_check': None
         }
+        
+        # 증분 집계 위치 (이미 집계한 바이트 수와 그 파일의 inode)
+        self._last_offset = 0
+        self._last_inode = None
     
     def start_monitoring(self):
-        """로그 모니터링을 시작합니다."""
-        if not self.monitoring:
-            self.monitoring = True
+        """로그 모니터링을 시작합니다. (파일 변경 이벤트 감시, 사용할 수 없으면 주기적 확인)"""
+        if self.monitoring:
+            return
+        self.monitoring = True
+        
+        try:
+            observer = Observer()
+            observer.schedule(_LogFileEventHandler(self), os.path.dirname(self.log_path), recursive=False)
+            observer.daemon = True
+            observer.start()
+            self.observer = observer
+            
+            # 시작 시점의 상태를 한 번 집계
+            self._schedule_check()
+        except Exception as e:
+            # inotify 감시 한도 초과 등으로 이벤트 감시를 시작할 수 없으면 주기적 확인으로 대체
+            print(f"로그 파일 이벤트 감시 시작 실패, 주기적 확인 사용: {e}")
+            self._stop_event.clear()
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
     
     def stop_monitoring(self):
         """로그 모니터링을 중지합니다."""
         self.monitoring = False
+        self._stop_event.set()
+        
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+        
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+        
         if self.monitor_thread:
-            self.monitor_thread.join()
+            self.monitor_thread.join(timeout=5)
+            self.monitor_thread = None
+    
+    def _schedule_check(self):
+        """디바운스 구간이 끝나면 로그 파일을 확인하도록 예약합니다. (이미 예약되어 있으면 무시)"""
+        with self._timer_lock:
+            if self._timer is not None or not self.monitoring:
+                return
+            
+            self._timer = threading.Timer(self.debounce_sec, self._run_scheduled_check)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _run_scheduled_check(self):
+        """예약된 로그 파일 확인을 실행합니다."""
+        with self._timer_lock:
+            self._timer = None
+        
+        try:
+            self._check_log_file()
+        except Exception as e:
+            print(f"로그 모니터링 오류: {e}")
     
     def _monitor_loop(self):
         """로그 모니터링 루프"""
-        while self.monitoring:
+        while True:
             try:
                 self._check_log_file()
-                time.sleep(60)  # 1분마다 체크
             except Exception as e:
                 print(f"로그 모니터링 오류: {e}")
+            
+            # 1분마다 체크 (오류가 나도 대기하며, 중지 신호가 오면 즉시 종료)
+            if self._stop_event.wait(60):
+                break
     
     def _check_log_file(self):
         """로그 파일 상태를 체크합니다."""
-        if not os.path.exists(self.log_file):
+        try:
+            st = os.stat(self.log_file)
+        except FileNotFoundError:
             return
         
-        # 파일 크기 체크
-        file_size = os.path.getsize(self.log_file)
+        # 파일 크기 체크 (변경 이벤트마다 확인하므로 경고는 한도를 넘을 때 한 번만 출력)
+        file_size = st.st_size
         if file_size > self.max_size_bytes:
-            print(f"⚠️  로그 파일이 너무 큽니다: {file_size / (1024*1024):.2f}MB")
+            if not self._size_warned:
+                print(f"⚠️  로그 파일이 너무 큽니다: {file_size / (1024*1024):.2f}MB")
+                self._size_warned = True
+        else:
+            self._size_warned = False
         
         # 로그 통계 업데이트
-        self._update_stats()
+        self._update_stats(st)
         self.stats['last_check'] = datetime.now()
     
-    def _update_stats(self):
-        """로그 통계를 업데이트합니다."""
+    def _update_stats(self, st: os.stat_result):
+        """로그 통계를 업데이트합니다. (지난번 이후 추가된 부분만 읽어 누적)"""
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                self.stats['total_logs'] = len(lines)
-                
-                # 에러 및 경고 카운트
-                error_count = sum(1 for line in lines if 'ERROR' in line or 'CRITICAL' in line)
-                warning_count = sum(1 for line in lines if 'WARNING' in line)
-                
-                self.stats['error_count'] = error_count
-                self.stats['warning_count'] = warning_count
+            # 로테이션으로 다른 파일이 되었거나 파일이 잘렸으면 처음부터 다시 집계
+            if st.st_ino != self._last_inode or st.st_size < self._last_offset:
+                self._last_inode = st.st_ino
+                self._last_offset = 0
+                self.stats['total_logs'] = 0
+                self.stats['error_count'] = 0
+                self.stats['warning_count'] = 0
+            
+            # 새로 기록된 내용이 없으면 읽지 않음
+            if st.st_size == self._last_offset:
+                return
+            
+            # 위치 이동과 읽기를 한 번의 pread로 수행
+            fd = os.open(self.log_file, os.O_RDONLY)
+            try:
+                data = os.pread(fd, st.st_size - self._last_offset, self._last_offset)
+            finally:
+                os.close(fd)
+            
+            # 아직 기록 중인 마지막 줄은 다음 확인 때 집계
+            end = data.rfind(b'\n') + 1
+            if not end:
+                return
+            data = data[:end]
+            self._last_offset += end
+            
+            # 줄 수와 레벨 필드(' - LEVEL - ') 개수로 집계
+            self.stats['total_logs'] += data.count(b'\n')
+            self.stats['error_count'] += data.count(b' - ERROR - ') + data.count(b' - CRITICAL - ')
+            self.stats['warning_count'] += data.count(b' - WARNING - ')
         except Exception:
             pass
     
@@ -111,44 +240,88 @@ class LogMonitor:
 class StructuredFormatter(logging.Formatter):
     """구조화된 로그 포맷터 (JSON 형식)"""
     
+    # 표준 json 사용 시 재사용하는 인코더 (json.dumps에 옵션을 넘기면 호출마다 인코더를 새로 만듦)
+    _json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 초 단위 타임스탬프 문자열 캐시 ((초, 문자열) 튜플 하나로 교체해 스레드 간 일관성 유지)
+        self._ts_cache = (None, '')
+    
+    def _format_timestamp(self, created: float) -> str:
+        """레코드 생성 시각을 ISO 형식 문자열로 변환합니다. (같은 초 안에서는 strftime 결과 재사용)"""
+        sec = int(created)
+        cached_sec, cached_str = self._ts_cache
+        if sec != cached_sec:
+            cached_str = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+            self._ts_cache = (sec, cached_str)
+        return f"{cached_str}.{int((created - sec) * 1e6):06d}"
+    
     def format(self, record):
+        # 메시지는 레코드에 한 번만 만들어 두고 재사용 (다른 포맷터도 record.message 사용)
+        record.message = record.getMessage()
+        
         # 기본 로그 정보
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._format_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
-            'message': record.getMessage(),
+            'message': record.message,
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno
         }
         
         # 추가 컨텍스트 정보
-        if hasattr(record, 'extra_data'):
-            log_entry.update(record.extra_data)
+        extra_data = record.__dict__.get('extra_data')
+        if extra_data:
+            log_entry.update(extra_data)
         
         # 예외 정보가 있으면 추가
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
         
-        return json.dumps(log_entry, ensure_ascii=False, indent=2)
+        # 한 줄 JSON (들여쓰기 없이 구분자 공백도 생략)
+        if orjson is not None:
+            return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode()
+        return self._json_encoder.encode(log_entry)
+
+
+# 로테이션된 로그 압축 전용 워커 (doRollover가 압축을 기다리지 않도록 백그라운드에서 처리)
+_compress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='LogCompress')
 
 
 class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
     """압축 기능이 포함된 로테이팅 파일 핸들러"""
     
+    # 압축 시 한 번에 읽는 크기 (기본 64KB 대신 1MB 단위로 읽어 시스템 콜 수 감소)
+    COMPRESS_CHUNK_SIZE = 1024 * 1024
+    
+    # 압축 파일 확장자 (zstandard 사용 가능 시 .zst, 아니면 .gz)
+    COMPRESS_SUFFIX = '.zst' if zstandard is not None else '.gz'
+    
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False, errors=None, compress=True):
         # RotatingFileHandler의 올바른 매개변수 순서로 전달
         super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
         self.compress = compress
+        
+        # 진행 중인 백그라운드 압축 작업
+        self._compress_future: Optional[Future] = None
     
     def doRollover(self):
-        """로그 파일 로테이션을 수행합니다."""
+        """로그 파일 로테이션을 수행합니다. (.1이 가장 최근 백업, 압축 사용 시 백업은 모두 압축 파일)"""
         if self.stream:
             self.stream.close()
             self.stream = None
         
+        # 이전 로테이션의 압축이 끝나기 전에 백업을 이동하면 세대가 꼬이므로 완료를 기다림
+        # (로테이션 간격이 압축 시간보다 훨씬 길어 보통은 이미 끝나 있음)
+        if self._compress_future is not None:
+            self._compress_future.result()
+            self._compress_future = None
+        
         if self.backupCount > 0:
+            # 기존 백업을 한 칸씩 뒤로 이동 (.i(.zst) -> .i+1(.zst), 마지막 세대는 덮어써서 제거)
             for i in range(self.backupCount - 1, 0, -1):
                 sfn = self.rotation_filename(self.baseFilename + "." + str(i))
                 dfn = self.rotation_filename(self.baseFilename + "." + str(i + 1))
@@ -157,24 +330,36 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
                         os.remove(dfn)
                     os.rename(sfn, dfn)
             
+            # 현재 로그 파일을 .1로 이동 (압축 사용 시 백그라운드에서 .1.zst로 압축)
             dfn = self.rotation_filename(self.baseFilename + ".1")
             if os.path.exists(dfn):
+                os.remove(dfn)
+            if os.path.exists(self.baseFilename):
                 if self.compress:
-                    # 기존 백업 파일을 압축
-                    self._compress_file(dfn)
+                    uncompressed = self.baseFilename + ".1"
+                    os.rename(self.baseFilename, uncompressed)
+                    self._compress_future = _compress_executor.submit(self._compress_file, uncompressed)
                 else:
-                    os.rename(dfn, dfn)
+                    os.rename(self.baseFilename, dfn)
         
         if not self.delay:
             self.stream = self._open()
     
     def _compress_file(self, filename):
-        """파일을 gzip으로 압축합니다."""
+        """파일을 압축합니다. (zstandard 레벨 3 스트리밍, 없으면 gzip 레벨 6)"""
         try:
+            compressed_filename = filename + self.COMPRESS_SUFFIX
             with open(filename, 'rb') as f_in:
-                compressed_filename = filename + '.gz'
-                with gzip.open(compressed_filename, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                if zstandard is not None:
+                    with open(compressed_filename, 'wb') as f_out:
+                        zstandard.ZstdCompressor(level=3).copy_stream(
+                            f_in, f_out,
+                            read_size=self.COMPRESS_CHUNK_SIZE,
+                            write_size=self.COMPRESS_CHUNK_SIZE
+                        )
+                else:
+                    with gzip.open(compressed_filename, 'wb', compresslevel=6) as f_out:
+                        shutil.copyfileobj(f_in, f_out, self.COMPRESS_CHUNK_SIZE)
             
             # 원본 파일 제거
             os.remove(filename)
@@ -183,8 +368,41 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
             pass
     
     def rotation_filename(self, filename):
-        """로테이션된 파일명을 생성합니다."""
-        return filename
+        """로테이션된 파일명을 생성합니다. (압축 사용 시 압축 확장자 추가)"""
+        return filename + self.COMPRESS_SUFFIX if self.compress else filename
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 큐에만 넣고 포맷은 리스너 스레드에 맡기는 큐 핸들러"""
+    
+    def prepare(self, record):
+        # 메시지 인자만 호출 스레드에서 병합 (인자 객체가 나중에 바뀌어도 기록 시점 값 유지)
+        # 포맷과 예외 문자열 변환은 리스너 스레드의 각 핸들러 포맷터가 수행
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# 로거 이름별로 실행 중인 큐 리스너 (같은 이름으로 다시 설정할 때 이전 리스너 정리)
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    """큐 리스너를 중지하고(남은 레코드 기록) 출력 핸들러를 닫습니다."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners():
+    """종료 시 큐에 남은 로그를 모두 기록합니다."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        _stop_listener(listener)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -200,22 +418,24 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # 리셋
     }
     
-    def format(self, record):
-        # 원본 메시지 저장
-        original_msg = record.getMessage()
-        
-        # 로그 레벨에 따른 색상 적용
-        if record.levelname in self.COLORS:
-            colored_level = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
-            record.levelname = colored_level
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         
-        # 포맷팅된 메시지 반환
+        # 레벨별 컬러 토큰을 미리 만들어 둠 (레코드마다 문자열 조합하지 않도록)
+        self._colored_levels = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
+    def format(self, record):
+        # 레코드는 여러 핸들러가 공유하므로 수정하지 않고, 포맷된 문자열의 레벨 토큰만 색칠
         formatted = super().format(record)
         
-        # 원본 메시지 복원 (다른 핸들러에 영향 주지 않도록)
-        record.msg = original_msg
+        colored_level = self._colored_levels.get(record.levelname)
+        if colored_level is None:
+            return formatted
         
-        return formatted
+        return formatted.replace(record.levelname, colored_level, 1)
 
 
 class LoggerManager:
@@ -224,6 +444,8 @@ class LoggerManager:
     def __init__(self, name: str = "file_monitor"):
         self.name = name
         self.logger = None
+        self.handlers: List[logging.Handler] = []
+        self.listener: Optional[logging.handlers.QueueListener] = None
         self.log_monitor = None
         self._setup_logger()
         self._setup_log_monitor()
@@ -235,7 +457,6 @@ class LoggerManager:
         
         # 로거 생성
         self.logger = logging.getLogger(self.name)
-        self.logger.setLevel(logging.DEBUG)  # 최소 레벨을 DEBUG로 설정
         
         # 기존 핸들러 제거 (중복 방지)
         for handler in self.logger.handlers[:]:
@@ -247,6 +468,21 @@ class LoggerManager:
         # 파일 핸들러 추가
         self._add_file_handler(config)
         
+        # 로거 레벨을 핸들러 최소 레벨로 설정 (어느 핸들러도 기록하지 않을 레코드는 호출 지점에서 바로 버림)
+        self.logger.setLevel(min(handler.level for handler in self.handlers))
+        
+        # 로거에는 큐 핸들러만 두고, 포맷과 콘솔/파일 기록은 백그라운드 리스너 스레드에서 수행
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_DeferredQueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(log_queue, *self.handlers, respect_handler_level=True)
+        
+        with _listeners_lock:
+            previous = _listeners.get(self.name)
+            _listeners[self.name] = self.listener
+        if previous:
+            _stop_listener(previous)
+        self.listener.start()
+        
         # 로거 전파 비활성화 (루트 로거로 전파되지 않도록)
         self.logger.propagate = False
     
@@ -277,7 +513,7 @@ class LoggerManager:
             )
         
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        self.handlers.append(console_handler)
     
     def _add_file_handler(self, config: Dict[str, Any]):
         """파일 핸들러를 추가합니다."""
@@ -305,7 +541,7 @@ class LoggerManager:
         formatter = logging.Formatter(file_format)
         file_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        self.handlers.append(file_handler)
     
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """
@@ -342,7 +578,7 @@ class LoggerManager:
         Args:
             filter_func: 필터 함수 (record를 받아서 True/False 반환)
         """
-        for handler in self.logger.handlers:
+        for handler in self.handlers:
             handler.addFilter(filter_func)
     
     def cleanup_old_logs(self, days_to_keep: int = 30):
@@ -359,10 +595,14 @@ class LoggerManager:
             
             cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
             
-            for log_file_path in log_dir.glob("*.log*"):
-                if log_file_path.stat().st_mtime < cutoff_time:
-                    log_file_path.unlink()
-                    print(f"오래된 로그 파일 삭제: {log_file_path}")
+            # scandir 항목의 stat 정보를 사용해 파일마다 경로를 다시 조회하지 않음
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if '.log' not in entry.name or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        print(f"오래된 로그 파일 삭제: {entry.path}")
         except Exception as e:
             print(f"로그 정리 중 오류 발생: {e}")
     
@@ -381,6 +621,10 @@ class LoggerManager:
         except AttributeError:
             level_no = logging.INFO
         
+        # 기록되지 않을 레벨이면 레코드를 만들지 않음
+        if not self.logger.isEnabledFor(level_no):
+            return
+        
         # 로그 레코드에 추가 정보 추가
         record = self.logger.makeRecord(
             self.logger.name, level_no, __file__, 0, message, (), None
@@ -397,13 +641,24 @@ class LoggerManager:
         return {}
     
     def __del__(self):
-        """소멸자: 로그 모니터링 중지"""
+        """소멸자: 로그 모니터링 및 (이 매니저가 시작한 경우) 큐 리스너 중지"""
         if self.log_monitor:
             self.log_monitor.stop_monitoring()
+        
+        if self.listener:
+            with _listeners_lock:
+                owned = _listeners.get(self.name) is self.listener
+                if owned:
+                    del _listeners[self.name]
+            if owned:
+                _stop_listener(self.listener)
+
 
+# 전역 로거 매니저 (import 시점이 아니라 처음 사용할 때 생성)
+@functools.lru_cache(maxsize=1)
+def _get_logger_manager() -> LoggerManager:
+    return LoggerManager()
 
-# 전역 로거 매니저 인스턴스
-_logger_manager = LoggerManager()
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
@@ -415,7 +670,7 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     Returns:
         설정된 로거 객체
     """
-    return _logger_manager.get_logger(name)
+    return _get_logger_manager().get_logger(name)
 
 
 def setup_logging(name: str = "file_monitor") -> LoggerManager:
@@ -438,7 +693,7 @@ def set_log_level(level: str):
     Args:
         level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    _logger_manager.set_level(level)
+    _get_logger_manager().set_level(level)
 
 
 def cleanup_old_logs(days_to_keep: int = 30):
@@ -448,7 +703,7 @@ def cleanup_old_logs(days_to_keep: int = 30):
     Args:
         days_to_keep: 보관할 로그 파일의 일수
     """
-    _logger_manager.cleanup_old_logs(days_to_keep)
+    _get_logger_manager().cleanup_old_logs(days_to_keep)
 
 
 def log_with_context(level: str, message: str, **context):
@@ -460,12 +715,12 @@ def log_with_context(level: str, message: str, **context):
         message: 로그 메시지
         **context: 추가 컨텍스트 정보
     """
-    _logger_manager.log_with_context(level, message, **context)
+    _get_logger_manager().log_with_context(level, message, **context)
 
 
 def get_log_stats() -> Dict[str, Any]:
     """로그 통계를 반환합니다."""
-    return _logger_manager.get_log_stats()
+    return _get_logger_manager().get_log_stats()
 
 
 # 로거 테스트
@@ -484,9 +739,9 @@ if __name__ == "__main__":
     print(f"\n로거 정보:")
     print(f"로거 이름: {logger.name}")
     print(f"로거 레벨: {logger.level}")
-    print(f"핸들러 수: {len(logger.handlers)}")
+    print(f"핸들러 수: {len(logger_manager.handlers)}")
     
-    for i, handler in enumerate(logger.handlers):
+    for i, handler in enumerate(logger_manager.handlers):
         print(f"핸들러 {i+1}: {type(handler).__name__}, 레벨: {handler.level}")
         if hasattr(handler, 'formatter') and handler.formatter:
             print(f"  포맷터: {type(handler.formatter).__name__}")
@@ -526,9 +781,9 @@ if __name__ == "__main__":
     
     # 압축 기능 테스트
     print(f"\n압축 기능 테스트:")
-    print(f"사용된 핸들러: {type(logger.handlers[1]).__name__}")
-    if hasattr(logger.handlers[1], 'compress'):
-        print(f"압축 기능 활성화: {logger.handlers[1].compress}")
+    print(f"사용된 핸들러: {type(logger_manager.handlers[1]).__name__}")
+    if hasattr(logger_manager.handlers[1], 'compress'):
+        print(f"압축 기능 활성화: {logger_manager.handlers[1].compress}")
     
     # 로그 정리 기능 테스트
     print(f"\n로그 정리 기능 테스트:")